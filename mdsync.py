@@ -7,34 +7,47 @@ import os
 import sys
 import re
 import argparse
+import importlib.util
 import json
 import yaml
 import difflib
+import functools
+import hashlib
 import uuid
 import time
+import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import TYPE_CHECKING, NamedTuple, Optional, Tuple
 
-from google.auth.transport.requests import Request
-from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
-from googleapiclient.discovery import build
+# The Google and Confluence client libraries are imported where they are used,
+# so commands that never touch an API (list, --list-batch, ...) start quickly.
+# HttpError is cheap and needed up front for the except clauses.
 from googleapiclient.errors import HttpError
-from googleapiclient.http import MediaIoBaseDownload, MediaFileUpload
 import io
 
-# Confluence imports
+if TYPE_CHECKING:
+    from googleapiclient.http import MediaIoBaseUpload
+
+# Confluence support is optional; atlassian is imported when a client is built
+CONFLUENCE_AVAILABLE = importlib.util.find_spec('atlassian') is not None
+
+# Optional fast JSON parsing for Google Docs API responses
 try:
-    from atlassian import Confluence
-    CONFLUENCE_AVAILABLE = True
+    import orjson
+    ORJSON_AVAILABLE = True
 except ImportError:
-    CONFLUENCE_AVAILABLE = False
-    Confluence = None
+    ORJSON_AVAILABLE = False
+    orjson = None
 
 # If modifying these scopes, delete the file token.json.
 SCOPES = ['https://www.googleapis.com/auth/documents', 
           'https://www.googleapis.com/auth/drive']
 
+# Shared read-only default for dict lookups on Docs API responses; never mutate
+EMPTY_DICT = {}
+
 
 def find_config_file(filename: str) -> Optional[str]:
     """Find a config file in multiple possible locations."""
@@ -51,15 +64,47 @@ def find_config_file(filename: str) -> Optional[str]:
     return None
 
 
+def _write_token_file(token_file: str, token_json: str) -> None:
+    """Atomically write token.json, readable only by the current user."""
+    tmp_path = f"{token_file}.{os.getpid()}.tmp"
+    try:
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'w') as token:
+            token.write(token_json)
+        os.replace(tmp_path, token_file)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+# Credentials loaded by get_credentials(), reused while they stay valid
+_CREDENTIALS = None
+
+
 def get_credentials():
-    """Get or create Google API credentials."""
-    creds = None
+    """Get or create Google API credentials.
+    
+    Credentials are kept for the rest of the run once loaded, so repeated calls
+    don't re-read token.json or refresh again until the token nears expiry.
+    """
+    global _CREDENTIALS
+    if _CREDENTIALS is not None and _CREDENTIALS.valid:
+        return _CREDENTIALS
+    
+    from google.auth.transport.requests import Request
+    from google.oauth2.credentials import Credentials
+    from google_auth_oauthlib.flow import InstalledAppFlow
+    
+    creds = _CREDENTIALS
     
     # Find token file
     token_file = find_config_file('token.json')
     
     # The file token.json stores the user's access and refresh tokens
-    if token_file and os.path.exists(token_file):
+    if creds is None and token_file and os.path.exists(token_file):
         creds = Credentials.from_authorized_user_file(token_file, SCOPES)
     
     # If there are no (valid) credentials available, let the user log in.
@@ -92,12 +137,217 @@ def get_credentials():
             else:
                 token_file = 'token.json'
         
-        with open(token_file, 'w') as token:
-            token.write(creds.to_json())
+        _write_token_file(token_file, creds.to_json())
     
+    _CREDENTIALS = creds
     return creds
 
 
+@functools.lru_cache(maxsize=None)
+def _discovery_document(service_name: str, version: str) -> Optional[str]:
+    """
+    Read the discovery document bundled with googleapiclient, once per API.
+    
+    The raw JSON is cached rather than the parsed dict: build_from_document
+    adds parameters to the methods of the dict it is given, so every build
+    must parse its own copy.
+    
+    Returns:
+        str: The document's JSON, or None if this API version is not bundled
+    """
+    from googleapiclient.discovery_cache import get_static_doc
+    
+    return get_static_doc(service_name, version)
+
+
+def build(service_name: str, version: str, **kwargs):
+    """
+    googleapiclient.discovery.build, imported on first use.
+    
+    Services are built from the bundled discovery document, read once per
+    process, instead of re-reading the file on every call. APIs that are not
+    bundled fall back to a regular discovery build.
+    """
+    document = _discovery_document(service_name, version)
+    if document is None:
+        from googleapiclient.discovery import build as discovery_build
+        return discovery_build(service_name, version, **kwargs)
+    
+    from googleapiclient.discovery import build_from_document
+    kwargs.pop('cache_discovery', None)
+    return build_from_document(document, **kwargs)
+
+
+@functools.lru_cache(maxsize=1)
+def _orjson_model_class():
+    """Return OrjsonModel, defining it on first use so googleapiclient.model loads lazily."""
+    from googleapiclient.model import JsonModel
+    
+    class OrjsonModel(JsonModel):
+        """JsonModel that parses API responses with orjson instead of the stdlib json module."""
+
+        def deserialize(self, content):
+            try:
+                body = orjson.loads(content)
+            except orjson.JSONDecodeError:
+                # Let the stock model handle non-JSON bodies the way it always has
+                return super().deserialize(content)
+            if self._data_wrapper and isinstance(body, dict) and 'data' in body:
+                body = body['data']
+            return body
+    
+    return OrjsonModel
+
+
+def build_docs_service(creds, **kwargs):
+    """Build the Google Docs API service, using orjson for responses when installed.
+
+    Docs API payloads carry the full document body, so JSON parsing becomes
+    noticeable CPU time once documents grow past a few hundred KB. Extra
+    keyword arguments are passed through to build().
+    """
+    if ORJSON_AVAILABLE:
+        return build('docs', 'v1', credentials=creds, model=_orjson_model_class()(), **kwargs)
+    return build('docs', 'v1', credentials=creds, **kwargs)
+
+
+# (docs_service, drive_service) shared by the batch commands; see get_google_services()
+_GOOGLE_SERVICES = None
+
+
+def get_google_services():
+    """
+    Return Docs and Drive services that share one authorized HTTP connection.
+    
+    The services are built on first use and reused for the rest of the run, so
+    consecutive API calls keep the same TLS connection instead of each build()
+    opening its own. The underlying httplib2.Http is not thread-safe: only use
+    these services from one thread at a time.
+    
+    Returns:
+        tuple: (docs_service, drive_service)
+    """
+    global _GOOGLE_SERVICES
+    if _GOOGLE_SERVICES is None:
+        from google_auth_httplib2 import AuthorizedHttp
+        from googleapiclient.http import build_http
+        
+        # build_http() keeps googleapiclient's default socket timeout, which
+        # Drive needs when converting a large batch upload
+        http = AuthorizedHttp(get_credentials(), http=build_http())
+        _GOOGLE_SERVICES = (
+            build_docs_service(None, http=http, cache_discovery=False),
+            build('drive', 'v3', http=http, cache_discovery=False),
+        )
+    return _GOOGLE_SERVICES
+
+
+# Uploads smaller than this use a single-request upload instead of a resumable session
+SIMPLE_UPLOAD_LIMIT = 5 * 1024 * 1024
+
+
+def markdown_upload(content: str) -> 'MediaIoBaseUpload':
+    """
+    Build a Drive upload for markdown content held in memory.
+    
+    Payloads under SIMPLE_UPLOAD_LIMIT go up as a single multipart request;
+    larger ones use a resumable session.
+    
+    Args:
+        content (str): Markdown to upload
+        
+    Returns:
+        MediaIoBaseUpload: Media body for files().create()/files().update()
+    """
+    from googleapiclient.http import MediaIoBaseUpload
+    
+    payload = content.encode('utf-8')
+    return MediaIoBaseUpload(
+        io.BytesIO(payload),
+        mimetype='text/markdown',
+        chunksize=-1,
+        resumable=len(payload) >= SIMPLE_UPLOAD_LIMIT
+    )
+
+
+# Exports are spooled in memory up to this size, then to a temp file
+EXPORT_SPOOL_LIMIT = 1024 * 1024
+
+# Buffer size for copying exported markdown to its destination file
+EXPORT_COPY_BUFSIZE = 1024 * 1024
+
+
+def write_markdown_export(output_path: str, header: str, body) -> None:
+    """
+    Write a frontmatter header followed by exported markdown to a file.
+    
+    The body is written after the header rather than concatenated with it, so
+    a large export is never held twice in memory.
+    
+    Args:
+        output_path (str): Destination markdown file
+        header (str): Frontmatter block, including its trailing blank line
+        body: Markdown as a str, or a binary file object positioned at its start
+    """
+    with open(output_path, 'wb', buffering=EXPORT_COPY_BUFSIZE) as f:
+        f.write(header.encode('utf-8'))
+        if isinstance(body, str):
+            f.write(body.encode('utf-8'))
+        else:
+            shutil.copyfileobj(body, f, EXPORT_COPY_BUFSIZE)
+
+# Retries for read-only Google API requests, passed to HttpRequest.execute(num_retries=...),
+# which backs off on rate limiting and transient server errors
+READ_RETRIES = 6
+
+# The only status a mutating request is retried on: a rate-limited request was not applied
+RATE_LIMITED_STATUS = 429
+
+
+def execute_with_backoff(request, max_retries: int = 6, max_delay: float = 32):
+    """
+    Execute a mutating Google API request, retrying only when it is rate limited.
+    
+    Server errors are not retried: a create or batchUpdate that failed or timed
+    out may still have been applied, and repeating it would duplicate the temp
+    document or the inserted content. Waits 1s, 2s, 4s, ... (capped at
+    max_delay) between attempts. Read-only requests should use
+    request.execute(num_retries=READ_RETRIES) instead.
+    
+    Args:
+        request: An unexecuted googleapiclient HttpRequest
+        max_retries (int): Retries before the last error is raised
+        max_delay (float): Longest wait between attempts, in seconds
+        
+    Returns:
+        The request's response
+    """
+    delay = 1
+    for attempt in range(max_retries + 1):
+        try:
+            return request.execute()
+        except HttpError as e:
+            if attempt == max_retries or e.resp.status != RATE_LIMITED_STATUS:
+                raise
+        time.sleep(delay)
+        delay = min(delay * 2, max_delay)
+
+
+# Partial-response masks for documents().get(); request only what the batch code reads
+DOC_TEXT_FIELDS = ('title,body(content(startIndex,endIndex,paragraph('
+                   'paragraphStyle/namedStyleType,elements/textRun(content,textStyle(bold,italic)))))')
+DOC_EXTENT_FIELDS = ('title,body(content(startIndex,endIndex,paragraph/paragraphStyle/namedStyleType,'
+                     'table/rows,tableOfContents/content/startIndex))')
+DOC_END_FIELDS = 'body(content(endIndex))'
+
+
+# Google Doc URL patterns, compiled once for the helpers below
+_DOC_ID_RE = re.compile(r'/document/d/([a-zA-Z0-9-_]+)')
+_DOC_ID_PARAM_RE = re.compile(r'id=([a-zA-Z0-9-_]+)')
+_BARE_DOC_ID_RE = re.compile(r'^([a-zA-Z0-9-_]+)$')
+
+
+@functools.lru_cache(maxsize=64)
 def extract_doc_id(url_or_id: str) -> str:
     """Extract document ID from a Google Docs URL or return the ID if already provided."""
     # If it's already just an ID (no slashes or dots), return it
@@ -105,7 +355,7 @@ def extract_doc_id(url_or_id: str) -> str:
         return url_or_id
     
     # Try to extract from URL
-    match = re.search(r'/document/d/([a-zA-Z0-9-_]+)', url_or_id)
+    match = _DOC_ID_RE.search(url_or_id)
     if match:
         return match.group(1)
     
@@ -130,8 +380,19 @@ def is_confluence_page(path: str) -> bool:
             (path.isdigit() and len(path) < 20))  # Confluence page IDs are numeric
 
 
+# Confluence page URL components
+_CONFLUENCE_SPACE_RE = re.compile(r'/spaces/([^/]+)')
+_CONFLUENCE_PAGE_RE = re.compile(r'/pages/(\d+)')
+
+
 def parse_confluence_destination(dest: str) -> dict:
     """Parse Confluence destination into components."""
+    # Parsed once per distinct string; callers get their own copy to modify
+    return dict(_parse_confluence_destination(dest))
+
+
+@functools.lru_cache(maxsize=64)
+def _parse_confluence_destination(dest: str) -> dict:
     result = {'type': None, 'space': None, 'page_id': None, 'page_title': None, 'url': None}
     
     if dest.startswith('confluence:'):
@@ -150,9 +411,8 @@ def parse_confluence_destination(dest: str) -> dict:
         result['type'] = 'confluence'
         result['url'] = dest
         # Extract space and page ID from URL
-        import re
-        space_match = re.search(r'/spaces/([^/]+)', dest)
-        page_match = re.search(r'/pages/(\d+)', dest)
+        space_match = _CONFLUENCE_SPACE_RE.search(dest)
+        page_match = _CONFLUENCE_PAGE_RE.search(dest)
         if space_match:
             result['space'] = space_match.group(1)
         if page_match:
@@ -235,6 +495,34 @@ def get_confluence_credentials(secrets_file_path: Optional[str] = None):
     }
 
 
+_CONFLUENCE_SESSION = None
+
+
+def get_confluence_session():
+    """
+    Return a requests.Session shared by the Confluence REST helpers.
+    
+    The session is created on first use and keeps connections alive, so the
+    several calls a lock, status or label operation makes reuse one TLS
+    connection instead of each opening its own. Connection failures on
+    idempotent requests are retried with a short backoff.
+    
+    Returns:
+        requests.Session: The shared session
+    """
+    global _CONFLUENCE_SESSION
+    if _CONFLUENCE_SESSION is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+        
+        session = requests.Session()
+        session.mount('https://', HTTPAdapter(pool_connections=10, pool_maxsize=10,
+                                              max_retries=Retry(total=3, backoff_factor=0.3)))
+        _CONFLUENCE_SESSION = session
+    return _CONFLUENCE_SESSION
+
+
 def get_confluence_client(secrets_file_path: Optional[str] = None):
     """Get Confluence API client from secrets.yaml, environment variables, or config.
     
@@ -312,6 +600,8 @@ def get_confluence_client(secrets_file_path: Optional[str] = None):
         print("\nSee secrets.yaml.example for template", file=sys.stderr)
         sys.exit(1)
     
+    from atlassian import Confluence
+    
     return Confluence(
         url=confluence_url,
         username=confluence_username,
@@ -320,6 +610,33 @@ def get_confluence_client(secrets_file_path: Optional[str] = None):
     )
 
 
+# Per-heading patterns used while converting markdown to Confluence storage format
+_MD_HEADING_LINE_RE = re.compile(r'^#{1,6}\s+(.+?)(?:\s+\{#([^}]+)\})?$')
+_HEADING_ANCHOR_SUFFIX_RE = re.compile(r'\s*\{#[^}]+\}\s*$')
+_MD_LINK_TEXT_RE = re.compile(r'\[([^\]]+)\]\([^\)]+\)')
+_MD_BOLD_RE = re.compile(r'\*\*([^*]+)\*\*')
+_MD_ITALIC_RE = re.compile(r'\*([^*]+)\*')
+_WHITESPACE_RUN_RE = re.compile(r'\s+')
+
+
+class LazyConfluenceClient:
+    """
+    Stand-in for the Confluence client that builds it on first use.
+    
+    Credential lookup and client setup (including any error exit for missing
+    credentials) happen only when a Confluence branch actually uses the client.
+    """
+    
+    def __init__(self, secrets_file_path: Optional[str] = None):
+        self._secrets_file_path = secrets_file_path
+        self._client = None
+    
+    def __getattr__(self, name):
+        if self._client is None:
+            self._client = get_confluence_client(self._secrets_file_path)
+        return getattr(self._client, name)
+
+
 def markdown_to_confluence_storage(markdown_content: str) -> str:
     """Convert markdown to Confluence storage format using proper HTML conversion.
     
@@ -360,14 +677,13 @@ def markdown_to_confluence_storage(markdown_content: str) -> str:
         # Confluence preserves case and uses URL encoding
         anchor = heading_text.strip()
         # Remove markdown formatting but preserve the text structure
-        anchor = re.sub(r'\*\*([^*]+)\*\*', r'\1', anchor)  # Remove bold
-        anchor = re.sub(r'\*([^*]+)\*', r'\1', anchor)  # Remove italic
-        anchor = re.sub(r'\[([^\]]+)\]\([^\)]+\)', r'\1', anchor)  # Remove links
+        anchor = _MD_BOLD_RE.sub(r'\1', anchor)  # Remove bold
+        anchor = _MD_ITALIC_RE.sub(r'\1', anchor)  # Remove italic
+        anchor = _MD_LINK_TEXT_RE.sub(r'\1', anchor)  # Remove links
         # Unescape escaped brackets (from markdown like \[IN PROGRESS\])
-        anchor = re.sub(r'\\\[', '[', anchor)  # Match \ followed by [
-        anchor = re.sub(r'\\\]', ']', anchor)  # Match \ followed by ]
+        anchor = anchor.replace('\\[', '[').replace('\\]', ']')
         # Replace spaces with hyphens (but keep case)
-        anchor = re.sub(r'\s+', '-', anchor)
+        anchor = _WHITESPACE_RUN_RE.sub('-', anchor)
         # URL encode (Confluence uses URL encoding for anchors)
         # Don't encode hyphens, they're part of the anchor format
         return urllib.parse.quote(anchor, safe='-')
@@ -384,7 +700,7 @@ def markdown_to_confluence_storage(markdown_content: str) -> str:
         
         # Remove markdown anchor syntax {#anchor} from heading text if present
         # This is formatting noise from Google Docs that shouldn't be displayed
-        clean_heading_text = re.sub(r'\s*\{#[^}]+\}\s*$', '', heading_text).strip()
+        clean_heading_text = _HEADING_ANCHOR_SUFFIX_RE.sub('', heading_text).strip()
         
         # Generate anchor from CLEAN heading text (without the {#...} part)
         anchor_id = generate_confluence_anchor(clean_heading_text)
@@ -402,19 +718,18 @@ def markdown_to_confluence_storage(markdown_content: str) -> str:
     # Map of markdown anchor names to Confluence anchors (for TOC links)
     # We'll build this by scanning the markdown content before conversion
     anchor_to_heading_map = {}
-    heading_pattern = r'^#{1,6}\s+(.+?)(?:\s+\{#([^}]+)\})?$'
     for line in markdown_content.split('\n'):
-        match = re.match(heading_pattern, line)
+        match = _MD_HEADING_LINE_RE.match(line)
         if match:
             heading_text = match.group(1).strip()
             explicit_anchor = match.group(2) if match.group(2) else None
             
             # Remove markdown anchor syntax {#anchor} from heading text if present
             # This is formatting noise that shouldn't be part of the anchor generation
-            clean_heading = re.sub(r'\s*\{#[^}]+\}\s*$', '', heading_text).strip()
+            clean_heading = _HEADING_ANCHOR_SUFFIX_RE.sub('', heading_text).strip()
             
             # Remove markdown link syntax from heading text for anchor generation
-            clean_heading = re.sub(r'\[([^\]]+)\]\([^\)]+\)', r'\1', clean_heading)  # Remove links
+            clean_heading = _MD_LINK_TEXT_RE.sub(r'\1', clean_heading)  # Remove links
             clean_heading = re.sub(r'\\\[([^\]]+)\\\]', r'[\1]', clean_heading)  # Unescape brackets
             
             # Generate anchor from CLEAN heading text (Confluence's way - without the {#...} part)
@@ -547,8 +862,13 @@ def markdown_to_confluence_storage(markdown_content: str) -> str:
     return confluence_content
 
 
-def export_confluence_to_markdown(page_id: str, confluence, output_path: str = None) -> str:
-    """Export a Confluence page to Markdown format using html2text for better conversion."""
+def export_confluence_to_markdown(page_id: str, confluence, output_path: str = None) -> Optional[str]:
+    """
+    Export a Confluence page to Markdown format using html2text for better conversion.
+    
+    With output_path, the markdown is written there with confluence_url frontmatter
+    and None is returned; otherwise the markdown is returned.
+    """
     try:
         import html2text
         from bs4 import BeautifulSoup
@@ -597,11 +917,9 @@ def export_confluence_to_markdown(page_id: str, confluence, output_path: str = N
         # If output path provided, add frontmatter with confluence_url
         if output_path:
             space_key = page.get('space', {}).get('key', '')
-            # Remove /wiki from the end of confluence.url if present
-            base_url = confluence.url.rstrip('/')
-            if base_url.endswith('/wiki'):
-                base_url = base_url[:-5]  # Remove '/wiki'
-            confluence_url = f"{base_url}/wiki/spaces/{space_key}/pages/{page_id}"
+            confluence_url = confluence_page_url(confluence, space_key, page_id)
+            
+            header = f"---\nconfluence_url: {confluence_url}\n---\n\n"
             
             # Check if content already has frontmatter
             if markdown_content.startswith('---'):
@@ -610,19 +928,13 @@ def export_confluence_to_markdown(page_id: str, confluence, output_path: str = N
                     import frontmatter
                     post = frontmatter.loads(markdown_content)
                     post.metadata['confluence_url'] = confluence_url
-                    frontmatter_content = frontmatter.dumps(post)
+                    header, markdown_content = '', frontmatter.dumps(post)
                 except Exception:
                     # Fallback: prepend frontmatter
-                    frontmatter_content = f"---\nconfluence_url: {confluence_url}\n---\n\n{markdown_content}"
-            else:
-                # Add frontmatter to the content
-                frontmatter_content = f"---\nconfluence_url: {confluence_url}\n---\n\n{markdown_content}"
-            
-            # Write to file
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(frontmatter_content)
+                    pass
             
-            return frontmatter_content
+            write_markdown_export(output_path, header, markdown_content)
+            return None
         else:
             return markdown_content.strip()
         
@@ -631,8 +943,17 @@ def export_confluence_to_markdown(page_id: str, confluence, output_path: str = N
         sys.exit(1)
 
 
-def import_markdown_to_confluence(markdown_path: str, page_id: str, confluence, quiet: bool = False):
-    """Import a Markdown file to an existing Confluence page."""
+def confluence_page_url(confluence, space_key: str, page_id: str) -> str:
+    """Build a page's web URL from the client's base URL, without an API call."""
+    # Remove /wiki from the end of confluence.url if present
+    base_url = confluence.url.rstrip('/')
+    if base_url.endswith('/wiki'):
+        base_url = base_url[:-5]  # Remove '/wiki'
+    return f"{base_url}/wiki/spaces/{space_key}/pages/{page_id}"
+
+
+def import_markdown_to_confluence(markdown_path: str, page_id: str, confluence, quiet: bool = False) -> str:
+    """Import a Markdown file to an existing Confluence page and return the page URL."""
     try:
         # Read the markdown file
         with open(markdown_path, 'r', encoding='utf-8') as f:
@@ -653,11 +974,7 @@ def import_markdown_to_confluence(markdown_path: str, page_id: str, confluence,
         title = page.get('title', '')
         
         # Generate Confluence URL
-        # Remove /wiki from the end of confluence.url if present
-        base_url = confluence.url.rstrip('/')
-        if base_url.endswith('/wiki'):
-            base_url = base_url[:-5]  # Remove '/wiki'
-        confluence_url = f"{base_url}/wiki/spaces/{space_key}/pages/{page_id}"
+        confluence_url = confluence_page_url(confluence, space_key, page_id)
         
         # Resolve internal markdown links to Confluence URLs
         base_dir = os.path.dirname(os.path.abspath(markdown_path))
@@ -701,6 +1018,8 @@ def import_markdown_to_confluence(markdown_path: str, page_id: str, confluence,
                 print(f"  Labels: {', '.join(frontmatter_labels)}")
             print(f"  Updated frontmatter in {markdown_path}")
         
+        return confluence_url
+        
     except FileNotFoundError:
         print(f"Error: Markdown file not found: {markdown_path}", file=sys.stderr)
         sys.exit(1)
@@ -727,18 +1046,371 @@ def extract_frontmatter_metadata(markdown_content: str) -> dict:
             'confluence_modified': post.metadata.get('confluence_modified'),
         }
     except Exception:
-        return {
-            'title': None, 
-            'labels': [], 
-            'parent': None, 
-            'gdoc_url': None,
-            'confluence_url': None,
-            'batch': None,
-            'gdoc_created': None,
-            'gdoc_modified': None,
-            'confluence_created': None,
-            'confluence_modified': None,
-        }
+        return _empty_frontmatter_metadata()
+
+
+def _empty_frontmatter_metadata() -> dict:
+    """Return the metadata dict extract_frontmatter_metadata produces for a file without frontmatter."""
+    return {
+        'title': None, 
+        'labels': [], 
+        'parent': None, 
+        'gdoc_url': None,
+        'confluence_url': None,
+        'batch': None,
+        'gdoc_created': None,
+        'gdoc_modified': None,
+        'confluence_created': None,
+        'confluence_modified': None,
+    }
+
+
+# Parsed markdown files keyed by path: {path: ((mtime_ns, size), metadata, stripped_content)}
+_FM_MEMO = {}
+
+
+def read_markdown_file(file_path: str) -> Tuple[dict, str]:
+    """
+    Read a markdown file once per change, returning its metadata and remote-sync content.
+    
+    Results are cached by path and invalidated when the file's mtime or size
+    changes, so a file that is scanned for batch metadata and then uploaded or
+    diffed in the same run is only read and parsed once.
+    
+    Args:
+        file_path (str): Path to the markdown file
+        
+    Returns:
+        tuple: (metadata as returned by extract_frontmatter_metadata,
+                content as returned by strip_frontmatter_for_remote_sync)
+    """
+    stat_result = os.stat(file_path)
+    fingerprint = (stat_result.st_mtime_ns, stat_result.st_size)
+    cached = _FM_MEMO.get(file_path)
+    if cached is not None and cached[0] == fingerprint:
+        return cached[1], cached[2]
+    
+    with open(file_path, 'r', encoding='utf-8') as f:
+        markdown_content = f.read()
+    
+    metadata = extract_frontmatter_metadata(markdown_content)
+    stripped = strip_frontmatter_for_remote_sync(markdown_content)
+    _FM_MEMO[file_path] = (fingerprint, metadata, stripped)
+    return metadata, stripped
+
+
+def cached_frontmatter(file_path: str) -> dict:
+    """
+    Return frontmatter metadata for a markdown file, parsing it at most once per change.
+    
+    Args:
+        file_path (str): Path to the markdown file
+        
+    Returns:
+        dict: Metadata as returned by extract_frontmatter_metadata
+    """
+    return read_markdown_file(file_path)[0]
+
+
+# Worker count for frontmatter scans; reads release the GIL, so oversubscribe the CPUs
+_SCAN_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Default worker count for reading batch members in --diff-batch/--batch-update
+DEFAULT_BATCH_PARALLELISM = 5
+
+
+# How much of each file to peek at before deciding whether a YAML parse is needed
+_FRONTMATTER_PEEK_BYTES = 4096
+# python-frontmatter strips leading whitespace before looking for the opener,
+# so skip it (and a UTF-8 BOM) here too
+_FM_OPEN_RE = re.compile(rb'(?:\xef\xbb\xbf)?\s*-{3,}[ \t]*\r?\n')
+_FM_OTHER_OPEN_RE = re.compile(rb'(?:\xef\xbb\xbf)?\s*(?:\+{3}|\{)')
+_FM_CLOSE_RE = re.compile(rb'^-{3,}[ \t]*\r?$', re.MULTILINE)
+_FM_BATCH_KEY_RE = re.compile(rb'^[ \t]*(["\']?)batch\1[ \t]*:', re.MULTILINE)
+_FM_FLOW_MAPPING_RE = re.compile(rb'\s*\{')
+
+
+def _read_frontmatter_prefix(file_path: str, cap: int = 16384) -> Tuple[bytes, bool]:
+    """
+    Read the start of a markdown file, enough to hold any realistic frontmatter.
+    
+    Returns:
+        tuple: (head, complete) where head is the raw bytes read and complete is
+               True if they hold the whole frontmatter block (or the file has none)
+    """
+    with open(file_path, 'rb') as f:
+        head = f.read(cap)
+    
+    complete = len(head) < cap
+    if not complete:
+        opening = _FM_OPEN_RE.match(head)
+        complete = opening is None or _FM_CLOSE_RE.search(head, opening.end()) is not None
+    
+    return head, complete
+
+
+def _frontmatter_from_prefix(file_path: str, head: bytes, complete: bool) -> dict:
+    """Parse frontmatter from a prefix read by _read_frontmatter_prefix, reading the whole file only if it is incomplete."""
+    if complete:
+        return extract_frontmatter_metadata(head.decode('utf-8', errors='replace'))
+    return cached_frontmatter(file_path)
+
+
+def read_frontmatter_metadata(file_path: str) -> dict:
+    """
+    Parse a markdown file's frontmatter without reading the body when possible.
+    
+    Only a bounded prefix is read; the whole file is read only if its
+    frontmatter runs past that prefix.
+    
+    Args:
+        file_path (str): Path to the markdown file
+        
+    Returns:
+        dict: Metadata as returned by extract_frontmatter_metadata
+    """
+    head, complete = _read_frontmatter_prefix(file_path)
+    return _frontmatter_from_prefix(file_path, head, complete)
+
+
+def _head_may_have_batch(head: bytes) -> bool:
+    """
+    Check the start of a markdown file for possible batch frontmatter.
+    
+    Heads that don't open with a '---' frontmatter block, or whose frontmatter
+    closes without a (possibly quoted) 'batch:' key, are rejected without a
+    YAML parse. Anything the peek can't rule out - TOML or JSON frontmatter, a
+    flow-style YAML mapping, a block running past the bytes read - is left to
+    the full parse.
+    """
+    opening = _FM_OPEN_RE.match(head)
+    if not opening:
+        if _FM_OTHER_OPEN_RE.match(head):
+            return True
+        # Nothing but whitespace so far; the opener may still follow
+        return len(head) >= _FRONTMATTER_PEEK_BYTES and not head.strip()
+    
+    closing = _FM_CLOSE_RE.search(head, opening.end())
+    if closing is None or _FM_FLOW_MAPPING_RE.match(head, opening.end()):
+        return True
+    
+    return _FM_BATCH_KEY_RE.search(head, opening.end(), closing.start()) is not None
+
+
+def _may_have_batch_frontmatter(file_path: str) -> bool:
+    """Cheaply check whether a markdown file could carry batch frontmatter, reading only its head."""
+    with open(file_path, 'rb') as f:
+        return _head_may_have_batch(f.read(_FRONTMATTER_PEEK_BYTES))
+
+
+def _scan_md(file_path: str) -> Tuple[Optional[dict], Optional[Exception]]:
+    """
+    Read and parse one markdown file's frontmatter, returning (metadata, error).
+    
+    Files that can't contain batch metadata are not parsed at all; they get the
+    empty metadata template so callers still see them as ungrouped.
+    """
+    try:
+        if not _may_have_batch_frontmatter(file_path):
+            return _empty_frontmatter_metadata(), None
+        return cached_frontmatter(file_path), None
+    except Exception as e:
+        return None, e
+
+
+class BatchFile(NamedTuple):
+    """A markdown file that belongs to a batch document, with its batch metadata unpacked."""
+    file_path: str
+    heading_title: str
+    batch_info: dict
+    doc_id: str = ''
+    batch_id: str = ''
+    batch_title: str = ''
+
+
+def _batch_file(file_path: str, batch_info: dict) -> BatchFile:
+    """Build a BatchFile from a file's 'batch' frontmatter dict."""
+    return BatchFile(
+        file_path=file_path,
+        heading_title=batch_info.get('heading_title', 'Unknown'),
+        batch_info=batch_info,
+        doc_id=batch_info.get('doc_id', ''),
+        batch_id=batch_info.get('batch_id', ''),
+        batch_title=batch_info.get('batch_title') or ''
+    )
+
+
+# Per-directory index of batch frontmatter, reused across invocations. It lives
+# in the user's cache directory, never in the scanned tree.
+BATCH_INDEX_DIR = os.path.join(os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache'), 'mdsync')
+
+
+def batch_index_path(root: str) -> str:
+    """Return the index file for a scanned directory, named after its real path."""
+    digest = hashlib.sha1(os.path.realpath(root).encode('utf-8', errors='surrogateescape')).hexdigest()
+    return os.path.join(BATCH_INDEX_DIR, f"index-{digest}.json")
+
+
+def load_batch_index(root: str) -> dict:
+    """
+    Load the batch frontmatter index for a directory.
+    
+    Args:
+        root (str): Directory the index belongs to
+        
+    Returns:
+        dict: {relative_path: {'mtime_ns': int, 'size': int, 'batch': dict or None}},
+              or an empty dict if the index is missing or unreadable
+    """
+    try:
+        with open(batch_index_path(root), 'r', encoding='utf-8') as f:
+            index = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    
+    return index if isinstance(index, dict) else {}
+
+
+def save_batch_index(root: str, index: dict) -> None:
+    """
+    Atomically write the batch frontmatter index for a directory.
+    
+    Failures (e.g. an unwritable cache directory) are ignored; the index is only a cache.
+    
+    Args:
+        root (str): Directory the index belongs to
+        index (dict): Index as returned by load_batch_index
+    """
+    index_path = batch_index_path(root)
+    tmp_path = f"{index_path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(BATCH_INDEX_DIR, exist_ok=True)
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            # YAML may hand back dates for created/modified; store them as strings
+            json.dump(index, f, default=str)
+        os.replace(tmp_path, index_path)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+
+# Directories the 'list' command never searches for markdown files
+MARKDOWN_EXCLUDE_DIRS = frozenset({'venv', 'env', '.venv', '.env', 'node_modules', '.git', '__pycache__',
+                                   '.pytest_cache', 'build', 'dist', '.tox'})
+
+# Directories batch scans skip: VCS metadata, caches and vendored packages only,
+# so batch files kept under e.g. build/ or dist/ still belong to their batch
+BATCH_SCAN_EXCLUDE_DIRS = frozenset({'.git', 'node_modules', '.venv', '__pycache__', '.pytest_cache'})
+
+
+def iter_markdown_files(directory: str, exclude: frozenset = MARKDOWN_EXCLUDE_DIRS):
+    """
+    Recursively yield markdown files under a directory, skipping excluded directories.
+    
+    Uses os.scandir so directory entries' file types come from the directory
+    listing itself. Symlinked directories are not followed, matching os.walk.
+    
+    Args:
+        directory (str): Directory to search
+        exclude (frozenset): Directory names not to descend into
+        
+    Yields:
+        tuple: (file_path, os.stat_result), with None for the stat result if
+               the file could not be stat'ed
+    """
+    try:
+        with os.scandir(directory) as entries:
+            entries = list(entries)
+    except OSError:
+        return
+    
+    # Like os.walk, list a directory's own files before descending
+    subdirs = []
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            if entry.name not in exclude:
+                subdirs.append(entry.path)
+        elif entry.name.endswith('.md') and entry.is_file():
+            try:
+                yield entry.path, entry.stat()
+            except OSError:
+                yield entry.path, None
+    
+    for subdir in subdirs:
+        yield from iter_markdown_files(subdir, exclude)
+
+
+def scan_markdown_frontmatter(directory: str, errors: Optional[dict] = None) -> list:
+    """
+    Find all markdown files under a directory and parse their frontmatter in parallel.
+    
+    Batch metadata is cached in an index under BATCH_INDEX_DIR. Files whose
+    mtime_ns and size match the index are only stat'ed; the rest are parsed and
+    the index is rewritten.
+    
+    Args:
+        directory (str): Directory to scan recursively
+        errors (dict, optional): Filled with {file_path: exception} for files
+                                 that could not be read
+        
+    Returns:
+        list: (file_path, metadata) tuples in discovery order; metadata is None
+              for files that could not be read. Only the 'batch' key is reliable:
+              files served from the index, and files without batch frontmatter,
+              get the empty metadata template with just 'batch' filled in.
+    """
+    md_files = list(iter_markdown_files(directory, BATCH_SCAN_EXCLUDE_DIRS))
+    
+    index = load_batch_index(directory)
+    new_index = {}
+    results = {}
+    stale = []
+    for file_path, stat_result in md_files:
+        if stat_result is None:
+            results[file_path] = None
+            if errors is not None:
+                try:
+                    os.stat(file_path)
+                except OSError as e:
+                    errors[file_path] = e
+            continue
+        
+        key = os.path.relpath(file_path, directory)
+        signature = (stat_result.st_mtime_ns, stat_result.st_size)
+        entry = index.get(key)
+        if entry is not None and (entry.get('mtime_ns'), entry.get('size')) == signature:
+            metadata = _empty_frontmatter_metadata()
+            metadata['batch'] = entry.get('batch')
+            results[file_path] = metadata
+            new_index[key] = entry
+        else:
+            stale.append((file_path, key, signature))
+    
+    stale_paths = [file_path for file_path, _, _ in stale]
+    if len(stale_paths) < 2:
+        parsed = [_scan_md(file_path) for file_path in stale_paths]
+    else:
+        with ThreadPoolExecutor(max_workers=_SCAN_WORKERS) as executor:
+            parsed = list(executor.map(_scan_md, stale_paths))
+    
+    for (file_path, key, signature), (metadata, error) in zip(stale, parsed):
+        results[file_path] = metadata
+        if error is not None and errors is not None:
+            errors[file_path] = error
+        if metadata is not None:
+            batch_info = metadata.get('batch')
+            new_index[key] = {
+                'mtime_ns': signature[0],
+                'size': signature[1],
+                'batch': batch_info if isinstance(batch_info, dict) else None,
+            }
+    
+    if stale or len(new_index) != len(index):
+        save_batch_index(directory, new_index)
+    
+    return [(file_path, results[file_path]) for file_path, _ in md_files]
 
 
 def update_frontmatter_metadata(content: str, metadata: dict) -> str:
@@ -870,11 +1542,8 @@ def resolve_markdown_links_to_confluence(markdown_content: str, base_dir: str =
         # Check if the referenced file exists and has confluence_url in frontmatter
         if os.path.exists(file_path):
             try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                
-                # Extract confluence_url from frontmatter
-                metadata = extract_frontmatter_metadata(content)
+                # Extract confluence_url from frontmatter; only the file's head is read
+                metadata = read_frontmatter_metadata(file_path)
                 confluence_url = metadata.get('confluence_url')
                 
                 if confluence_url:
@@ -923,12 +1592,12 @@ def check_confluence_frozen_status(page_id: str, confluence) -> bool:
             return False
         
         # Use the existing check_confluence_lock_status logic
-        import requests
+        session = get_confluence_session()
         
         url = f"{confluence_creds['url']}/rest/api/content/{page_id}/restriction"
         auth = (confluence_creds['username'], confluence_creds['api_token'])
         
-        response = requests.get(url, auth=auth)
+        response = session.get(url, auth=auth)
         if response.status_code == 200:
             restrictions = response.json()
             # Check if there are UPDATE restrictions
@@ -944,19 +1613,11 @@ def check_confluence_frozen_status(page_id: str, confluence) -> bool:
 
 def extract_doc_id_from_url(url: str) -> str:
     """Extract Google Doc ID from various URL formats."""
-    import re
-    
-    # Handle different Google Docs URL formats
-    patterns = [
-        r'/document/d/([a-zA-Z0-9-_]+)',  # Standard format
-        r'id=([a-zA-Z0-9-_]+)',          # Alternative format
-        r'^([a-zA-Z0-9-_]+)$'            # Just the ID
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, url)
-        if match:
-            return match.group(1)
+    # Handle different Google Docs URL formats: standard, alternative (id=), or just the ID
+    for pattern in (_DOC_ID_RE, _DOC_ID_PARAM_RE, _BARE_DOC_ID_RE):
+        match = pattern.search(url)
+        if match:
+            return match.group(1)
     
     return None
 
@@ -1004,7 +1665,7 @@ def lock_confluence_page(page_id: str, confluence_url: str, username: str, api_t
     Everyone else can view but not edit (read-only).
     """
     try:
-        import requests
+        session = get_confluence_session()
         import json
         
         # Get default permissions from config if not provided
@@ -1067,7 +1728,7 @@ def lock_confluence_page(page_id: str, confluence_url: str, username: str, api_t
             'Accept': 'application/json'
         }
         
-        response = requests.put(
+        response = session.put(
             url,
             headers=headers,
             data=json.dumps(restrictions_data),
@@ -1088,12 +1749,12 @@ def lock_confluence_page(page_id: str, confluence_url: str, username: str, api_t
 def unlock_confluence_page(page_id: str, confluence_url: str, username: str, api_token: str) -> bool:
     """Unlock a Confluence page by removing all restrictions."""
     try:
-        import requests
+        session = get_confluence_session()
         
         # Delete all restrictions
         url = f"{confluence_url}/wiki/rest/api/content/{page_id}/restriction"
         
-        response = requests.delete(
+        response = session.delete(
             url,
             auth=(username, api_token)
         )
@@ -1112,11 +1773,11 @@ def unlock_confluence_page(page_id: str, confluence_url: str, username: str, api
 def check_confluence_lock_status(page_id: str, confluence_url: str, username: str, api_token: str):
     """Check and display the lock status of a Confluence page."""
     try:
-        import requests
+        session = get_confluence_session()
         
         url = f"{confluence_url}/wiki/rest/api/content/{page_id}?expand=restrictions.read.restrictions.user,restrictions.read.restrictions.group,restrictions.update.restrictions.user,restrictions.update.restrictions.group"
         
-        response = requests.get(
+        response = session.get(
             url,
             auth=(username, api_token)
         )
@@ -1156,12 +1817,12 @@ def check_confluence_lock_status(page_id: str, confluence_url: str, username: st
 def _resolve_user_email_to_account_id(email: str, confluence_url: str, username: str, api_token: str) -> str:
     """Resolve a user email to Confluence account ID."""
     try:
-        import requests
+        session = get_confluence_session()
         
         # Try current user endpoint first
         if email == username:
             url = f"{confluence_url}/wiki/rest/api/user/current"
-            response = requests.get(url, auth=(username, api_token))
+            response = session.get(url, auth=(username, api_token))
             if response.status_code == 200:
                 return response.json().get('accountId')
         
@@ -1169,7 +1830,7 @@ def _resolve_user_email_to_account_id(email: str, confluence_url: str, username:
         search_url = f"{confluence_url}/wiki/rest/api/search/user"
         params = {"cql": f'user="{email}"'}
         
-        response = requests.get(
+        response = session.get(
             search_url,
             params=params,
             auth=(username, api_token)
@@ -1194,12 +1855,12 @@ def set_confluence_labels(page_id: str, labels: list, confluence_url: str, usern
     Similar to md2confluence's _set_page_labels_authoritatively.
     """
     try:
-        import requests
+        session = get_confluence_session()
         import json
         
         # Step 1: Get existing labels
         get_url = f"{confluence_url}/wiki/rest/api/content/{page_id}?expand=metadata.labels"
-        get_response = requests.get(
+        get_response = session.get(
             get_url,
             auth=(username, api_token)
         )
@@ -1214,7 +1875,7 @@ def set_confluence_labels(page_id: str, labels: list, confluence_url: str, usern
         if existing_labels:
             for label_name in existing_labels:
                 delete_url = f"{confluence_url}/wiki/rest/api/content/{page_id}/label/{label_name}"
-                requests.delete(
+                session.delete(
                     delete_url,
                     auth=(username, api_token)
                 )
@@ -1229,7 +1890,7 @@ def set_confluence_labels(page_id: str, labels: list, confluence_url: str, usern
                 'Content-Type': 'application/json'
             }
             
-            add_response = requests.post(
+            add_response = session.post(
                 add_url,
                 headers=headers,
                 data=json.dumps(labels_data),
@@ -1284,11 +1945,7 @@ def create_confluence_page(markdown_path: str, confluence, space: str, title: st
         page_id = new_page['id']
         
         # Generate Confluence URL
-        # Remove /wiki from the end of confluence.url if present
-        base_url = confluence.url.rstrip('/')
-        if base_url.endswith('/wiki'):
-            base_url = base_url[:-5]  # Remove '/wiki'
-        confluence_url = f"{base_url}/wiki/spaces/{space}/pages/{page_id}"
+        confluence_url = confluence_page_url(confluence, space, page_id)
         
         # Update frontmatter with Confluence URL
         update_frontmatter_confluence_url(markdown_path, confluence_url)
@@ -1621,9 +2278,16 @@ def print_comments_markdown(doc_name: str, doc_id: str, comments: list):
         print("---\n")
 
 
-def export_gdoc_to_markdown(doc_id: str, creds, output_path: str = None) -> str:
-    """Export a Google Doc to Markdown format."""
+def export_gdoc_to_markdown(doc_id: str, creds, output_path: str = None) -> Optional[str]:
+    """
+    Export a Google Doc to Markdown format.
+    
+    With output_path, the export is streamed to that file behind gdoc frontmatter
+    and None is returned; otherwise the markdown is returned.
+    """
     try:
+        from googleapiclient.http import MediaIoBaseDownload
+        
         # Build the Drive service (used for export)
         drive_service = build('drive', 'v3', credentials=creds)
         
@@ -1644,22 +2308,36 @@ def export_gdoc_to_markdown(doc_id: str, creds, output_path: str = None) -> str:
             mimeType='text/markdown'
         )
         
-        file_stream = io.BytesIO()
-        downloader = MediaIoBaseDownload(file_stream, request)
-        
-        done = False
-        while not done:
-            status, done = downloader.next_chunk()
-        
-        # Get the content as string
-        markdown_content = file_stream.getvalue().decode('utf-8')
+        if not output_path:
+            file_stream = io.BytesIO()
+            downloader = MediaIoBaseDownload(file_stream, request)
+            
+            done = False
+            while not done:
+                status, done = downloader.next_chunk()
+            
+            return file_stream.getvalue().decode('utf-8')
         
-        # If output path provided, add frontmatter with gdoc_url and metadata
-        if output_path:
+        # Spool the export so a large document is copied to disk, not decoded and concatenated
+        with tempfile.SpooledTemporaryFile(max_size=EXPORT_SPOOL_LIMIT) as spool:
+            downloader = MediaIoBaseDownload(spool, request)
+            
+            done = False
+            while not done:
+                status, done = downloader.next_chunk()
+            
+            # Add frontmatter with gdoc_url and metadata
             gdoc_url = f"https://docs.google.com/document/d/{doc_id}/edit"
+            header = f"---\ntitle: {doc_title}\ngdoc_url: {gdoc_url}\ngdoc_created: {created_time}\ngdoc_modified: {modified_time}\n---\n\n"
+            
+            spool.seek(0)
+            body = spool
             
             # Check if content already has frontmatter
-            if markdown_content.startswith('---'):
+            if spool.read(3) == b'---':
+                spool.seek(0)
+                markdown_content = spool.read().decode('utf-8')
+                body = markdown_content
                 # Parse existing frontmatter and add/update metadata
                 try:
                     import frontmatter
@@ -1668,21 +2346,16 @@ def export_gdoc_to_markdown(doc_id: str, creds, output_path: str = None) -> str:
                     post.metadata['gdoc_url'] = gdoc_url
                     post.metadata['gdoc_created'] = created_time
                     post.metadata['gdoc_modified'] = modified_time
-                    frontmatter_content = frontmatter.dumps(post)
+                    header, body = '', frontmatter.dumps(post)
                 except Exception:
                     # Fallback: prepend frontmatter
-                    frontmatter_content = f"---\ntitle: {doc_title}\ngdoc_url: {gdoc_url}\ngdoc_created: {created_time}\ngdoc_modified: {modified_time}\n---\n\n{markdown_content}"
+                    pass
             else:
-                # Add frontmatter to the content
-                frontmatter_content = f"---\ntitle: {doc_title}\ngdoc_url: {gdoc_url}\ngdoc_created: {created_time}\ngdoc_modified: {modified_time}\n---\n\n{markdown_content}"
+                spool.seek(0)
             
-            # Write to file
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(frontmatter_content)
-            
-            return frontmatter_content
-        else:
-            return markdown_content
+            write_markdown_export(output_path, header, body)
+        
+        return None
         
     except HttpError as error:
         print(f"An error occurred: {error}", file=sys.stderr)
@@ -1705,8 +2378,8 @@ def strip_frontmatter_for_remote_sync(markdown_content: str) -> str:
     return markdown_content
 
 
-def show_diff(content1: str, content2: str, label1: str, label2: str):
-    """Show a unified diff between two content strings."""
+def unified_diff_lines(content1: str, content2: str, label1: str, label2: str) -> list:
+    """Return the unified diff between two content strings as a list of lines."""
     # Normalize line endings
     content1 = content1.replace('\r\n', '\n').replace('\r', '\n')
     content2 = content2.replace('\r\n', '\n').replace('\r', '\n')
@@ -1716,15 +2389,16 @@ def show_diff(content1: str, content2: str, label1: str, label2: str):
     lines2 = content2.splitlines(keepends=True)
     
     # Generate unified diff
-    diff = difflib.unified_diff(
+    return list(difflib.unified_diff(
         lines1, lines2,
         fromfile=label1,
         tofile=label2,
         lineterm=''
-    )
-    
-    # Print the diff
-    diff_lines = list(diff)
+    ))
+
+
+def print_diff(diff_lines: list):
+    """Print diff lines from unified_diff_lines, or a note that there are none."""
     if diff_lines:
         print("=" * 60)
         print("DIFF (DRY RUN - No changes made):")
@@ -1736,6 +2410,46 @@ def show_diff(content1: str, content2: str, label1: str, label2: str):
         print("No differences found - files are identical")
 
 
+def show_diff(content1: str, content2: str, label1: str, label2: str):
+    """Show a unified diff between two content strings."""
+    print_diff(unified_diff_lines(content1, content2, label1, label2))
+
+
+# Below this much text to diff (in characters, both sides of every job), computing
+# the diffs in-process beats starting worker processes and pickling the text to them
+_PROCESS_DIFF_MIN_CHARS = 2 * 1024 * 1024
+
+
+def compute_unified_diffs(jobs: list) -> list:
+    """
+    Run unified_diff_lines over a list of (content1, content2, label1, label2) jobs.
+    
+    Diffing is CPU-bound, so when there is enough text and more than one CPU
+    the jobs are spread across worker processes; results come back in job
+    order either way.
+    
+    Args:
+        jobs (list): Argument tuples for unified_diff_lines
+        
+    Returns:
+        list: One list of diff lines per job
+    """
+    workers = min(len(jobs), os.cpu_count() or 1)
+    if workers > 1 and sum(len(job[0]) + len(job[1]) for job in jobs) >= _PROCESS_DIFF_MIN_CHARS:
+        import pickle
+        from concurrent.futures import ProcessPoolExecutor
+        from concurrent.futures.process import BrokenProcessPool
+        
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                return list(pool.map(unified_diff_lines, *zip(*jobs)))
+        except (OSError, BrokenProcessPool, pickle.PicklingError):
+            # No usable worker processes here (e.g. sandboxed); diff in-process
+            pass
+    
+    return [unified_diff_lines(*job) for job in jobs]
+
+
 def diff_markdown_to_gdoc(markdown_path: str, doc_id: str, creds):
     """Show diff between markdown file and Google Doc (dry run)."""
     try:
@@ -1875,50 +2589,30 @@ def diff_confluence_to_markdown(confluence_dest: str, markdown_path: str, conflu
 def import_markdown_to_gdoc(markdown_path: str, doc_id: str, creds, quiet: bool = False):
     """Import a Markdown file to a Google Doc."""
     try:
-        # Read the markdown file
-        with open(markdown_path, 'r', encoding='utf-8') as f:
-            markdown_content = f.read()
+        # Read the markdown file, stripping frontmatter for Google Doc (frontmatter
+        # is for markdown processing only); reuses the parse from main()'s checks
+        _, content_for_gdoc = read_markdown_file(markdown_path)
         
-        # Strip frontmatter for Google Doc (frontmatter is for markdown processing only)
-        content_for_gdoc = strip_frontmatter_for_remote_sync(markdown_content)
+        # Build the Drive service
+        drive_service = build('drive', 'v3', credentials=creds)
         
-        # Create a temporary file with the cleaned content
-        temp_file_path = f"{markdown_path}.temp"
-        with open(temp_file_path, 'w', encoding='utf-8') as f:
-            f.write(content_for_gdoc)
+        # Update the document by uploading the cleaned markdown straight from memory
+        file_metadata = {
+            'mimeType': 'application/vnd.google-apps.document'
+        }
         
-        try:
-            # Build the Drive service
-            drive_service = build('drive', 'v3', credentials=creds)
-            
-            # Update the document by uploading the cleaned markdown
-            media = MediaFileUpload(
-                temp_file_path,
-                mimetype='text/markdown',
-                resumable=True
-            )
-            
-            file_metadata = {
-                'mimeType': 'application/vnd.google-apps.document'
-            }
-            
-            updated_file = drive_service.files().update(
-                fileId=doc_id,
-                media_body=media,
-                body=file_metadata
-            ).execute()
-            
-            if not quiet:
-                print(f"Successfully updated Google Doc: {doc_id}")
-            
-            # Update frontmatter with sync date
-            gdoc_url = f"https://docs.google.com/document/d/{doc_id}/edit"
-            update_frontmatter_gdoc_url(markdown_path, gdoc_url)
-            
-        finally:
-            # Clean up temporary file
-            if os.path.exists(temp_file_path):
-                os.remove(temp_file_path)
+        updated_file = drive_service.files().update(
+            fileId=doc_id,
+            media_body=markdown_upload(content_for_gdoc),
+            body=file_metadata
+        ).execute()
+        
+        if not quiet:
+            print(f"Successfully updated Google Doc: {doc_id}")
+        
+        # Update frontmatter with sync date
+        gdoc_url = f"https://docs.google.com/document/d/{doc_id}/edit"
+        update_frontmatter_gdoc_url(markdown_path, gdoc_url)
         
     except HttpError as error:
         print(f"An error occurred: {error}", file=sys.stderr)
@@ -1938,46 +2632,29 @@ def create_new_gdoc_from_markdown_with_title(markdown_path: str, title: str, cre
         # Strip frontmatter for Google Doc (frontmatter is for markdown processing only)
         content_for_gdoc = strip_frontmatter_for_remote_sync(markdown_content)
         
-        # Create a temporary file with the cleaned content
-        temp_file_path = f"{markdown_path}.temp"
-        with open(temp_file_path, 'w', encoding='utf-8') as f:
-            f.write(content_for_gdoc)
+        # Build the Drive service
+        drive_service = build('drive', 'v3', credentials=creds)
         
-        try:
-            # Build the Drive service
-            drive_service = build('drive', 'v3', credentials=creds)
-            
-            # Upload the cleaned markdown file and convert it to Google Docs format
-            file_metadata = {
-                'name': title,
-                'mimeType': 'application/vnd.google-apps.document'
-            }
-            
-            media = MediaFileUpload(
-                temp_file_path,
-                mimetype='text/markdown',
-                resumable=True
-            )
-            
-            # Create the Google Doc
-            file = drive_service.files().create(
-                body=file_metadata,
-                media_body=media,
-                fields='id'
-            ).execute()
-            
-            doc_id = file.get('id')
-            
-            if not quiet:
-                print(f'Created new Google Doc with ID: {doc_id}')
-                print(f'URL: https://docs.google.com/document/d/{doc_id}/edit')
-            
-            return doc_id
-            
-        finally:
-            # Clean up temporary file
-            if os.path.exists(temp_file_path):
-                os.unlink(temp_file_path)
+        # Upload the cleaned markdown from memory and convert it to Google Docs format
+        file_metadata = {
+            'name': title,
+            'mimeType': 'application/vnd.google-apps.document'
+        }
+        
+        # Create the Google Doc
+        file = drive_service.files().create(
+            body=file_metadata,
+            media_body=markdown_upload(content_for_gdoc),
+            fields='id'
+        ).execute()
+        
+        doc_id = file.get('id')
+        
+        if not quiet:
+            print(f'Created new Google Doc with ID: {doc_id}')
+            print(f'URL: https://docs.google.com/document/d/{doc_id}/edit')
+        
+        return doc_id
                 
     except Exception as e:
         print(f'Error creating Google Doc: {e}', file=sys.stderr)
@@ -1987,63 +2664,40 @@ def create_new_gdoc_from_markdown_with_title(markdown_path: str, title: str, cre
 def create_new_gdoc_from_markdown(markdown_path: str, creds, quiet: bool = False) -> str:
     """Create a new Google Doc from a Markdown file."""
     try:
-        # Read the markdown file
-        with open(markdown_path, 'r', encoding='utf-8') as f:
-            markdown_content = f.read()
+        # Read the markdown file once for the title metadata and the frontmatter-stripped
+        # content (frontmatter is for markdown processing only)
+        metadata, content_for_gdoc = read_markdown_file(markdown_path)
         
-        # Extract frontmatter metadata for title
-        metadata = extract_frontmatter_metadata(markdown_content)
+        # Build the Drive service
+        drive_service = build('drive', 'v3', credentials=creds)
         
-        # Strip frontmatter for Google Doc (frontmatter is for markdown processing only)
-        content_for_gdoc = strip_frontmatter_for_remote_sync(markdown_content)
+        # Get the document name (frontmatter title takes priority over filename)
+        doc_name = metadata.get('title') or Path(markdown_path).stem
         
-        # Create a temporary file with the cleaned content
-        temp_file_path = f"{markdown_path}.temp"
-        with open(temp_file_path, 'w', encoding='utf-8') as f:
-            f.write(content_for_gdoc)
+        # Upload the cleaned markdown from memory and convert it to Google Docs format
+        file_metadata = {
+            'name': doc_name,
+            'mimeType': 'application/vnd.google-apps.document'
+        }
         
-        try:
-            # Build the Drive service
-            drive_service = build('drive', 'v3', credentials=creds)
-            
-            # Get the document name (frontmatter title takes priority over filename)
-            doc_name = metadata.get('title') or Path(markdown_path).stem
-            
-            # Upload the cleaned markdown file and convert it to Google Docs format
-            file_metadata = {
-                'name': doc_name,
-                'mimeType': 'application/vnd.google-apps.document'
-            }
-            
-            media = MediaFileUpload(
-                temp_file_path,
-                mimetype='text/markdown',
-                resumable=True
-            )
-            
-            file = drive_service.files().create(
-                body=file_metadata,
-                media_body=media,
-                fields='id'
-            ).execute()
-            
-            doc_id = file.get('id')
-            gdoc_url = f"https://docs.google.com/document/d/{doc_id}/edit"
-            
-            # Update frontmatter with the Google Doc URL
-            update_frontmatter_gdoc_url(markdown_path, gdoc_url)
-            
-            if not quiet:
-                print(f"Created new Google Doc with ID: {doc_id}")
-                print(f"URL: {gdoc_url}")
-                print(f"Updated frontmatter in {markdown_path}")
-            
-            return doc_id
+        file = drive_service.files().create(
+            body=file_metadata,
+            media_body=markdown_upload(content_for_gdoc),
+            fields='id'
+        ).execute()
         
-        finally:
-            # Clean up temporary file
-            if os.path.exists(temp_file_path):
-                os.remove(temp_file_path)
+        doc_id = file.get('id')
+        gdoc_url = f"https://docs.google.com/document/d/{doc_id}/edit"
+        
+        # Update frontmatter with the Google Doc URL
+        update_frontmatter_gdoc_url(markdown_path, gdoc_url)
+        
+        if not quiet:
+            print(f"Created new Google Doc with ID: {doc_id}")
+            print(f"URL: {gdoc_url}")
+            print(f"Updated frontmatter in {markdown_path}")
+        
+        return doc_id
         
     except HttpError as error:
         print(f"An error occurred: {error}", file=sys.stderr)
@@ -2104,7 +2758,6 @@ def check_sync_status(markdown_path: str, destination_type: str, destination_id:
 
 def list_markdown_files(path: str, output_format: str = 'text', check_status: bool = False, show_diff: bool = False, secrets_file_path: Optional[str] = None):
     """List frontmatter information for markdown files."""
-    import glob
     import json
     
     # Determine if path is file or directory
@@ -2114,17 +2767,12 @@ def list_markdown_files(path: str, output_format: str = 'text', check_status: bo
             sys.exit(1)
         files = [path]
     elif os.path.isdir(path):
-        # Find all markdown files in directory (exclude common build/cache directories)
-        pattern = os.path.join(path, '**', '*.md')
-        all_files = glob.glob(pattern, recursive=True)
-        
-        # Filter out common build/cache directories
-        exclude_dirs = {'venv', 'env', '.venv', '.env', 'node_modules', '.git', '__pycache__', '.pytest_cache', 'build', 'dist', '.tox'}
+        # Find all markdown files in directory; iter_markdown_files never enters
+        # the excluded build/cache directories. Hidden files and directories are
+        # skipped, as the recursive glob this used to run did.
         files = []
-        for file_path in all_files:
-            # Check if any part of the path contains excluded directories
-            path_parts = file_path.split(os.sep)
-            if not any(part in exclude_dirs for part in path_parts):
+        for file_path, _ in iter_markdown_files(path):
+            if not any(part.startswith('.') for part in os.path.relpath(file_path, path).split(os.sep)):
                 files.append(file_path)
         
         if not files:
@@ -2134,22 +2782,19 @@ def list_markdown_files(path: str, output_format: str = 'text', check_status: bo
         print(f"Error: {path} is not a valid file or directory", file=sys.stderr)
         sys.exit(1)
     
-    # Get credentials if status checking is enabled
+    # Get credentials if status checking is enabled; the Confluence client is
+    # only built once a file actually references a Confluence page
     creds = None
     confluence = None
     if check_status:
         creds = get_credentials()
-        confluence = get_confluence_client(secrets_file_path)
     
     results = []
     
     for file_path in files:
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # Extract frontmatter metadata
-            metadata = extract_frontmatter_metadata(content)
+            # Extract frontmatter metadata without reading the body
+            metadata = read_frontmatter_metadata(file_path)
             
             # Determine export locations
             export_locations = []
@@ -2183,6 +2828,9 @@ def list_markdown_files(path: str, output_format: str = 'text', check_status: bo
                     'url': metadata['confluence_url']
                 }
                 
+                if check_status and confluence is None:
+                    confluence = get_confluence_client(secrets_file_path)
+                
                 if check_status and confluence:
                     dest_info = parse_confluence_destination(metadata['confluence_url'])
                     page_id = dest_info.get('page_id')
@@ -2348,7 +2996,8 @@ def display_frontmatter_info(results, check_status: bool = False, show_diff: boo
                 print("   Export Locations: None")
 
 
-def check_existing_gdoc_confirmation(markdown_path: str, force: bool = False, destination_doc_id: str = None) -> bool:
+def check_existing_gdoc_confirmation(markdown_path: str, force: bool = False, destination_doc_id: str = None,
+                                     metadata: dict = None) -> bool:
     """
     Check if markdown file has existing gdoc_url and ask for confirmation if not forcing.
     
@@ -2356,15 +3005,14 @@ def check_existing_gdoc_confirmation(markdown_path: str, force: bool = False, de
         markdown_path (str): Path to markdown file
         force (bool): If True, skip confirmation
         destination_doc_id (str): Optional destination document ID to compare with existing
+        metadata (dict): Frontmatter already parsed by the caller; read from the file if None
         
     Returns:
         bool: True if should proceed, False if should skip
     """
     try:
-        with open(markdown_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        metadata = extract_frontmatter_metadata(content)
+        if metadata is None:
+            metadata = cached_frontmatter(markdown_path)
         existing_gdoc_url = metadata.get('gdoc_url')
         
         if existing_gdoc_url and not force:
@@ -2426,7 +3074,7 @@ def create_empty_document(title: str, quiet: bool = False) -> str:
     """
     try:
         creds = get_credentials()
-        docs_service = build('docs', 'v1', credentials=creds)
+        docs_service = build_docs_service(creds)
         
         # Create empty document
         doc = docs_service.documents().create(body={'title': title}).execute()
@@ -2447,6 +3095,10 @@ def create_empty_document(title: str, quiet: bool = False) -> str:
         return None
 
 
+# H1 headings: lines starting with # followed by space
+_H1_LINE_RE = re.compile(r'^#\s+(.+)$')
+
+
 def check_for_formatted_h1_headings(markdown_content: str, quiet: bool = False) -> list:
     """
     Check for H1 headings that have markdown formatting (bold, italic, etc.).
@@ -2459,15 +3111,10 @@ def check_for_formatted_h1_headings(markdown_content: str, quiet: bool = False)
     Returns:
         list: List of formatted H1 headings found
     """
-    import re
-    
     formatted_headings = []
     
-    # Pattern to match H1 headings with formatting
-    h1_pattern = r'^#\s+(.+)$'
-    
     for line in markdown_content.split('\n'):
-        match = re.match(h1_pattern, line.strip())
+        match = _H1_LINE_RE.match(line.strip())
         if match:
             heading_text = match.group(1).strip()
             
@@ -2499,14 +3146,10 @@ def extract_h1_headings_from_markdown(content: str) -> list:
     Returns:
         list: List of H1 heading texts
     """
-    import re
-    
-    # Pattern to match H1 headings (lines starting with # followed by space)
-    h1_pattern = r'^#\s+(.+)$'
     headings = []
     
     for line in content.split('\n'):
-        match = re.match(h1_pattern, line.strip())
+        match = _H1_LINE_RE.match(line.strip())
         if match:
             headings.append(match.group(1).strip())
     
@@ -2550,49 +3193,53 @@ def create_working_toc_links_in_gdoc(doc_id: str, headings: list, creds, quiet:
         quiet (bool): If True, suppress output messages
     """
     try:
-        docs_service = build('docs', 'v1', credentials=creds)
+        docs_service = build_docs_service(creds)
         
         # Get the document
         doc = docs_service.documents().get(documentId=doc_id).execute()
         
+        body_content = doc.get('body', {}).get('content', [])
+
         # Find all headings and their IDs
         heading_ids = {}
-        for element in doc.get('body', {}).get('content', []):
-            if 'paragraph' in element:
-                paragraph = element['paragraph']
-                if 'paragraphStyle' in paragraph:
-                    style = paragraph['paragraphStyle']
-                    if style.get('namedStyleType') == 'HEADING_1':
-                        # This is a heading, find its ID
-                        if 'elements' in paragraph and len(paragraph['elements']) > 0:
-                            first_element = paragraph['elements'][0]
-                            if 'textRun' in first_element:
-                                heading_text = first_element['textRun'].get('content', '').strip()
-                                
-                                # Look for heading ID in various places
-                                heading_id = None
-                                
-                                # Method 1: Check if heading already has an ID in textStyle.link
-                                if 'headingId' in first_element.get('textRun', {}).get('textStyle', {}).get('link', {}):
-                                    heading_id = first_element['textRun']['textStyle']['link']['headingId']
-                                
-                                # Method 2: Check if there's a headingId in the paragraph style
-                                elif 'headingId' in paragraph.get('paragraphStyle', {}):
-                                    heading_id = paragraph['paragraphStyle']['headingId']
-                                
-                                # Method 3: Generate a heading ID based on the text (Google Docs format)
-                                if not heading_id and heading_text:
-                                    # Google Docs generates IDs like "h.abc123def456"
-                                    # We'll create a simple one based on the text
-                                    import hashlib
-                                    text_hash = hashlib.md5(heading_text.lower().encode()).hexdigest()[:12]
-                                    heading_id = f"h.{text_hash}"
-                                
-                                if heading_id:
-                                    heading_ids[heading_text] = heading_id
-                                    if not quiet:
-                                        print(f"  Found heading: '{heading_text}' -> {heading_id}")
-        
+        for element in body_content:
+            paragraph = element.get('paragraph')
+            if paragraph is None:
+                continue
+            style = paragraph.get('paragraphStyle')
+            if style is None or style.get('namedStyleType') != 'HEADING_1':
+                continue
+            # This is a heading, find its ID
+            elements = paragraph.get('elements')
+            if not elements:
+                continue
+            text_run = elements[0].get('textRun')
+            if text_run is None:
+                continue
+            heading_text = text_run.get('content', '').strip()
+
+            # Look for heading ID in various places
+            heading_id = None
+
+            # Method 1: Check if heading already has an ID in textStyle.link
+            try:
+                heading_id = text_run['textStyle']['link']['headingId']
+            except KeyError:
+                # Method 2: Check if there's a headingId in the paragraph style
+                heading_id = style.get('headingId')
+
+            # Method 3: Generate a heading ID based on the text (Google Docs format)
+            if not heading_id and heading_text:
+                # Google Docs generates IDs like "h.abc123def456"
+                # We'll create a simple one based on the text
+                text_hash = hashlib.md5(heading_text.lower().encode()).hexdigest()[:12]
+                heading_id = f"h.{text_hash}"
+
+            if heading_id:
+                heading_ids[heading_text] = heading_id
+                if not quiet:
+                    print(f"  Found heading: '{heading_text}' -> {heading_id}")
+
         if not heading_ids:
             if not quiet:
                 print("ℹ No headings with IDs found - headings may not be properly formatted")
@@ -2601,69 +3248,79 @@ def create_working_toc_links_in_gdoc(doc_id: str, headings: list, creds, quiet:
         # Find the TOC section and replace links
         requests = []
         
-        for element in doc.get('body', {}).get('content', []):
-            if 'paragraph' in element:
-                paragraph = element['paragraph']
-                if 'elements' in paragraph:
-                    for elem in paragraph['elements']:
-                        if 'textRun' in elem:
-                            text_content = elem['textRun'].get('content', '')
-                            # Check if this looks like a TOC item
-                            for heading_text in headings:
-                                # Check if this is a TOC item (exact match with heading text)
-                                if (text_content.strip() == heading_text and 
-                                    'Table of Contents' not in text_content):
-                                    
-                                    # Find the best matching heading ID
-                                    best_match = None
-                                    best_heading = None
-                                    
-                                    # Try exact match first
-                                    if heading_text in heading_ids:
-                                        best_match = heading_ids[heading_text]
-                                        best_heading = heading_text
-                                    else:
-                                        # Try partial matches
-                                        for doc_heading, heading_id in heading_ids.items():
-                                            if heading_text.lower() in doc_heading.lower() or doc_heading.lower() in heading_text.lower():
-                                                best_match = heading_id
-                                                best_heading = doc_heading
-                                                break
-                                    
-                                    if best_match:
-                                        # Create a link to the heading
-                                        start_index = elem['startIndex']
-                                        end_index = elem['endIndex']
-                                        
-                                        # Update the text style to include a link
-                                        requests.append({
-                                            'updateTextStyle': {
-                                                'range': {
-                                                    'startIndex': start_index,
-                                                    'endIndex': end_index
-                                                },
-                                                'textStyle': {
-                                                    'link': {
-                                                        'headingId': best_match
-                                                    },
-                                                    'foregroundColor': {
-                                                        'color': {
-                                                            'rgbColor': {
-                                                                'red': 0.06666667,
-                                                                'green': 0.33333334,
-                                                                'blue': 0.8
-                                                            }
-                                                        }
-                                                    },
-                                                    'underline': True
-                                                },
-                                                'fields': 'link,foregroundColor,underline'
+        append = requests.append
+        lowered_ids = [(doc_heading.lower(), doc_heading, heading_id)
+                       for doc_heading, heading_id in heading_ids.items()]
+
+        for element in body_content:
+            paragraph = element.get('paragraph')
+            if paragraph is None:
+                continue
+            for elem in paragraph.get('elements', ()):
+                text_run = elem.get('textRun')
+                if text_run is None:
+                    continue
+                text_content = text_run.get('content', '')
+                if 'Table of Contents' in text_content:
+                    continue
+                stripped = text_content.strip()
+                # Check if this looks like a TOC item
+                for heading_text in headings:
+                    # Check if this is a TOC item (exact match with heading text)
+                    if stripped != heading_text:
+                        continue
+
+                    # Find the best matching heading ID
+                    best_match = None
+                    best_heading = None
+
+                    # Try exact match first
+                    if heading_text in heading_ids:
+                        best_match = heading_ids[heading_text]
+                        best_heading = heading_text
+                    else:
+                        # Try partial matches
+                        heading_lower = heading_text.lower()
+                        for doc_lower, doc_heading, heading_id in lowered_ids:
+                            if heading_lower in doc_lower or doc_lower in heading_lower:
+                                best_match = heading_id
+                                best_heading = doc_heading
+                                break
+
+                    if best_match:
+                        # Create a link to the heading
+                        start_index = elem['startIndex']
+                        end_index = elem['endIndex']
+
+                        # Update the text style to include a link
+                        append({
+                            'updateTextStyle': {
+                                'range': {
+                                    'startIndex': start_index,
+                                    'endIndex': end_index
+                                },
+                                'textStyle': {
+                                    'link': {
+                                        'headingId': best_match
+                                    },
+                                    'foregroundColor': {
+                                        'color': {
+                                            'rgbColor': {
+                                                'red': 0.06666667,
+                                                'green': 0.33333334,
+                                                'blue': 0.8
                                             }
-                                        })
-                                        
-                                        if not quiet:
-                                            print(f"  Linking TOC item: '{heading_text}' -> '{best_heading}' ({best_match})")
-        
+                                        }
+                                    },
+                                    'underline': True
+                                },
+                                'fields': 'link,foregroundColor,underline'
+                            }
+                        })
+
+                        if not quiet:
+                            print(f"  Linking TOC item: '{heading_text}' -> '{best_heading}' ({best_match})")
+
         # Apply the requests
         if requests:
             docs_service.documents().batchUpdate(
@@ -2688,7 +3345,7 @@ def fix_toc_links_in_gdoc(doc_id: str, creds, quiet: bool = False) -> None:
     This replaces markdown-style links with Google Docs internal links.
     """
     try:
-        docs_service = build('docs', 'v1', credentials=creds)
+        docs_service = build_docs_service(creds)
         
         # Get the document
         doc = docs_service.documents().get(documentId=doc_id).execute()
@@ -2726,51 +3383,57 @@ def ensure_heading_formatting_in_gdoc(doc_id: str, creds, quiet: bool = False) -
     This is necessary for TOC links to work correctly.
     """
     try:
-        docs_service = build('docs', 'v1', credentials=creds)
+        docs_service = build_docs_service(creds)
         
         # Get the document
         doc = docs_service.documents().get(documentId=doc_id).execute()
         
         # Find all paragraphs that start with '#' and format them as Heading 1
         requests = []
-        
+        append = requests.append
+
         for element in doc.get('body', {}).get('content', []):
-            if 'paragraph' in element:
-                paragraph = element['paragraph']
-                if 'elements' in paragraph and len(paragraph['elements']) > 0:
-                    # Check if this paragraph starts with a single '#' (H1)
-                    first_element = paragraph['elements'][0]
-                    if 'textRun' in first_element:
-                        text_content = first_element['textRun'].get('content', '')
-                        if text_content.startswith('# ') and not text_content.startswith('##'):
-                            # This should be an H1 heading
-                            start_index = element['startIndex']
-                            end_index = element['endIndex']
-                            
-                            # Remove the '#' prefix
-                            requests.append({
-                                'deleteTextRange': {
-                                    'range': {
-                                        'startIndex': start_index,
-                                        'endIndex': start_index + 2
-                                    }
-                                }
-                            })
-                            
-                            # Set the paragraph style to Heading 1
-                            requests.append({
-                                'updateParagraphStyle': {
-                                    'range': {
-                                        'startIndex': start_index,
-                                        'endIndex': end_index - 2
-                                    },
-                                    'paragraphStyle': {
-                                        'namedStyleType': 'HEADING_1'
-                                    },
-                                    'fields': 'namedStyleType'
-                                }
-                            })
-        
+            paragraph = element.get('paragraph')
+            if paragraph is None:
+                continue
+            elements = paragraph.get('elements')
+            if not elements:
+                continue
+            # Check if this paragraph starts with a single '#' (H1)
+            text_run = elements[0].get('textRun')
+            if text_run is None:
+                continue
+            if not text_run.get('content', '').startswith('# '):
+                continue
+
+            # This should be an H1 heading
+            start_index = element['startIndex']
+            end_index = element['endIndex']
+
+            # Remove the '#' prefix
+            append({
+                'deleteTextRange': {
+                    'range': {
+                        'startIndex': start_index,
+                        'endIndex': start_index + 2
+                    }
+                }
+            })
+
+            # Set the paragraph style to Heading 1
+            append({
+                'updateParagraphStyle': {
+                    'range': {
+                        'startIndex': start_index,
+                        'endIndex': end_index - 2
+                    },
+                    'paragraphStyle': {
+                        'namedStyleType': 'HEADING_1'
+                    },
+                    'fields': 'namedStyleType'
+                }
+            })
+
         # Apply all requests if any were found
         if requests:
             if not quiet:
@@ -2831,7 +3494,79 @@ def generate_batch_id(title: str) -> str:
     return clean_id or 'batch'
 
 
-def create_batch_document_simple(markdown_files: list, title: str, quiet: bool = False, include_headers: bool = False, include_horizontal_sep: bool = False, include_title: bool = True, include_toc: bool = False) -> str:
+def _load_batch_inputs(paths: list) -> dict:
+    """
+    Read each batch input file once and parse its frontmatter.
+    
+    Args:
+        paths (list): Markdown file paths, in batch order
+        
+    Returns:
+        dict: {path: {'content': str, 'metadata': dict}} in batch order;
+              files that could not be read are left out
+    """
+    batch_inputs = {}
+    for path in paths:
+        if path in batch_inputs:
+            continue
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                content = f.read()
+        except Exception:
+            continue
+        batch_inputs[path] = {'content': content, 'metadata': extract_frontmatter_metadata(content)}
+    return batch_inputs
+
+
+def _check_file_in_batch(file_path: str, expected_doc_id: str) -> Optional[str]:
+    """Return file_path if its batch frontmatter points at expected_doc_id, else None."""
+    try:
+        # Read the head once; most files have no batch frontmatter, and for the
+        # rest it usually holds the whole block
+        head, complete = _read_frontmatter_prefix(file_path)
+        if not _head_may_have_batch(head):
+            return None
+        metadata = _frontmatter_from_prefix(file_path, head, complete)
+    except Exception:
+        return None
+    
+    batch_info = metadata.get('batch')
+    if isinstance(batch_info, dict) and batch_info.get('doc_id') == expected_doc_id:
+        return file_path
+    return None
+
+
+# Batch loops print at most about this many progress lines, plus one whenever
+# PROGRESS_MIN_INTERVAL seconds have passed since the last
+PROGRESS_STEPS = 100
+PROGRESS_MIN_INTERVAL = 0.25
+
+
+class ProgressThrottle:
+    """
+    Decide which items of a batch loop get a "Processing i/N" line.
+    
+    Batches of up to PROGRESS_STEPS files report every file; larger ones
+    report every N/PROGRESS_STEPS files, the last file, and any file reached
+    after a PROGRESS_MIN_INTERVAL pause, so slow steps still show progress.
+    """
+    
+    def __init__(self, total: int):
+        self.total = total
+        self.step = max(1, total // PROGRESS_STEPS)
+        self.last_report = None
+    
+    def due(self, index: int) -> bool:
+        """Return True if the item at 0-based index should be reported."""
+        now = time.monotonic()
+        if (index % self.step == 0 or index == self.total - 1 or self.last_report is None or
+                now - self.last_report >= PROGRESS_MIN_INTERVAL):
+            self.last_report = now
+            return True
+        return False
+
+
+def create_batch_document_simple(markdown_files: list, title: str, quiet: bool = False, include_headers: bool = False, include_horizontal_sep: bool = False, include_title: bool = True, include_toc: bool = False, batch_inputs: Optional[dict] = None) -> str:
     """
     Create a Google Doc by combining multiple markdown files client-side.
     
@@ -2847,6 +3582,8 @@ def create_batch_document_simple(markdown_files: list, title: str, quiet: bool =
         include_horizontal_sep (bool): If True, add horizontal separators between files
         include_title (bool): If True, include the batch title as the main document title
         include_toc (bool): If True, generate and include a table of contents for H1 headings
+        batch_inputs (dict, optional): Preloaded files from _load_batch_inputs; files
+                                       missing from it are read from disk
         
     Returns:
         str: Document ID of the created document, or None if failed
@@ -2858,24 +3595,31 @@ def create_batch_document_simple(markdown_files: list, title: str, quiet: bool =
         if not quiet:
             print(f'Combining {len(markdown_files)} files into single document...')
         
-        # Create a temporary combined markdown file
-        combined_content = ""
+        # Collect the combined markdown as parts and join once at the end, so
+        # building it stays linear in the total size of the batch
+        combined_parts = []
         all_h1_headings = []  # Collect all H1 headings for TOC generation
         
         # Note: We don't add the title to content when include_title=True
         # because the document title will be set separately
         
+        progress = ProgressThrottle(len(markdown_files))
         for i, markdown_path in enumerate(markdown_files):
-            if not quiet:
+            if not quiet and progress.due(i):
                 print(f'  Processing {i+1}/{len(markdown_files)}: {markdown_path}')
             
             try:
-                # Read markdown file
-                with open(markdown_path, 'r', encoding='utf-8') as f:
-                    markdown_content = f.read()
-                
-                # Extract metadata
-                metadata = extract_frontmatter_metadata(markdown_content)
+                preloaded = batch_inputs.get(markdown_path) if batch_inputs else None
+                if preloaded is not None:
+                    markdown_content = preloaded['content']
+                    metadata = preloaded['metadata']
+                else:
+                    # Read markdown file
+                    with open(markdown_path, 'r', encoding='utf-8') as f:
+                        markdown_content = f.read()
+                    
+                    # Extract metadata
+                    metadata = extract_frontmatter_metadata(markdown_content)
                 
                 # Get heading title from frontmatter or filename
                 heading_title = metadata.get('title')
@@ -2902,15 +3646,15 @@ def create_batch_document_simple(markdown_files: list, title: str, quiet: bool =
                 # Add content with or without headers
                 if include_headers:
                     # When using headers, make the file title an H1 heading for proper anchor creation
-                    combined_content += f"# {heading_title}\n\n{content_for_combined}\n\n"
+                    combined_parts.append(f"# {heading_title}\n\n{content_for_combined}\n\n")
                 else:
                     # Without headers, ensure any existing H1 headings remain as H1
                     # (they should already be H1 from the original markdown)
-                    combined_content += f"{content_for_combined}\n\n"
+                    combined_parts.append(f"{content_for_combined}\n\n")
                 
                 # Add horizontal separator after each file (except the last one) if requested
                 if include_horizontal_sep and i < len(markdown_files) - 1:
-                    combined_content += "\n\n---\n\n"
+                    combined_parts.append("\n\n---\n\n")
                 
                 if not quiet:
                     print(f'    ✓ Added: {heading_title}')
@@ -2923,13 +3667,13 @@ def create_batch_document_simple(markdown_files: list, title: str, quiet: bool =
         # Generate and prepend table of contents if requested
         if include_toc and all_h1_headings:
             toc_content = generate_table_of_contents(all_h1_headings)
-            combined_content = toc_content + "\n" + combined_content
+            combined_parts[:0] = [toc_content, "\n"]
             if not quiet:
                 print(f'✓ Generated table of contents with {len(all_h1_headings)} headings')
         
         # Create temporary file
         temp_file = tempfile.NamedTemporaryFile(mode='w', suffix='.md', delete=False, encoding='utf-8')
-        temp_file.write(combined_content)
+        temp_file.write(''.join(combined_parts))
         temp_file.close()
         
         try:
@@ -3014,7 +3758,8 @@ def create_batch_document_simple(markdown_files: list, title: str, quiet: bool =
 # Removed: update_heading_content - replaced by batch functionality
 
 
-def diff_batch_against_gdoc(doc_id: str, quiet: bool = False) -> None:
+def diff_batch_against_gdoc(doc_id: str, quiet: bool = False,
+                            parallelism: int = DEFAULT_BATCH_PARALLELISM) -> None:
     """
     Diff an entire batch against its Google Doc.
     
@@ -3025,6 +3770,7 @@ def diff_batch_against_gdoc(doc_id: str, quiet: bool = False) -> None:
     Args:
         doc_id (str): Google Doc ID to diff against
         quiet (bool): If True, suppress output messages
+        parallelism (int): Number of files to read concurrently
         
     Example:
         diff_batch_against_gdoc("1ABC123def456")
@@ -3034,27 +3780,7 @@ def diff_batch_against_gdoc(doc_id: str, quiet: bool = False) -> None:
         from collections import defaultdict
         
         # Find all markdown files that belong to this batch
-        batch_files = []
-        for root, dirs, files in os.walk('.'):
-            for file in files:
-                if file.endswith('.md'):
-                    file_path = os.path.join(root, file)
-                    try:
-                        with open(file_path, 'r', encoding='utf-8') as f:
-                            content = f.read()
-                        
-                        metadata = extract_frontmatter_metadata(content)
-                        
-                        if 'batch' in metadata and isinstance(metadata['batch'], dict):
-                            batch_info = metadata['batch']
-                            if batch_info.get('doc_id') == doc_id:
-                                batch_files.append({
-                                    'file_path': file_path,
-                                    'heading_title': batch_info.get('heading_title', 'Unknown'),
-                                    'batch_info': batch_info
-                                })
-                    except Exception:
-                        continue
+        batch_files = [entry for entry in iter_batch_entries('.') if entry.doc_id == doc_id]
         
         if not batch_files:
             if not quiet:
@@ -3066,11 +3792,10 @@ def diff_batch_against_gdoc(doc_id: str, quiet: bool = False) -> None:
             print("=" * 60)
         
         # Get the Google Doc content
-        creds = get_credentials()
-        docs_service = build('docs', 'v1', credentials=creds)
+        docs_service, _ = get_google_services()
         
         try:
-            doc = docs_service.documents().get(documentId=doc_id).execute()
+            doc = docs_service.documents().get(documentId=doc_id, fields=DOC_TEXT_FIELDS).execute()
             doc_title = doc.get('title', 'Unknown')
         except Exception as e:
             print(f"Error accessing Google Doc: {e}", file=sys.stderr)
@@ -3081,61 +3806,127 @@ def diff_batch_against_gdoc(doc_id: str, quiet: bool = False) -> None:
             print(f"URL: https://docs.google.com/document/d/{doc_id}/edit")
             print()
         
-        # For each batch file, find its corresponding section in the Google Doc
-        for file_info in batch_files:
-            file_path = file_info['file_path']
-            heading_title = file_info['heading_title']
-            
-            if not quiet:
-                print(f"Checking: {os.path.basename(file_path)} -> {heading_title}")
-            
+        heading_map = build_heading_section_map(doc)
+        
+        # Read every file concurrently up front; the comparisons below are in-memory
+        with ThreadPoolExecutor(max_workers=max(1, min(parallelism, len(batch_files)))) as executor:
+            read_results = list(executor.map(_read_remote_content, (entry.file_path for entry in batch_files)))
+        
+        # For each batch file, find its corresponding section in the Google Doc and
+        # compare digests: (heading_section, differs, error) per file
+        checks = []
+        for file_info, (content_for_gdoc, read_error) in zip(batch_files, read_results):
             try:
-                # Read the markdown file
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    markdown_content = f.read()
+                if read_error is not None:
+                    raise read_error
                 
-                # Strip frontmatter for comparison
-                content_for_gdoc = strip_frontmatter_for_remote_sync(markdown_content)
+                # Find the heading section in the Google Doc, falling back to the
+                # first heading that contains the title
+                title_key = file_info.heading_title.lower()
+                if title_key not in heading_map:
+                    title_key = next((key for key in heading_map if title_key in key), None)
+                heading_section = heading_map[title_key][2] if title_key is not None else ""
                 
-                # Find the heading section in the Google Doc
-                heading_section = find_heading_section_in_gdoc(doc, heading_title)
+                # Sections from build_heading_section_map are already stripped
+                differs = bool(heading_section) and content_for_gdoc.strip() != heading_section
                 
-                if heading_section:
-                    # Compare the content
-                    if content_for_gdoc.strip() != heading_section.strip():
-                        if not quiet:
-                            print(f"  ⚠️  Differences found in '{heading_title}'")
-                            show_diff(
-                                heading_section,
-                                content_for_gdoc,
-                                f"Google Doc '{heading_title}'",
-                                f"Markdown '{os.path.basename(file_path)}'"
-                            )
-                        else:
-                            print(f"DIFF: {file_path}")
-                    else:
-                        if not quiet:
-                            print(f"  ✓  No differences in '{heading_title}'")
+                checks.append((heading_section, differs, None))
+            except Exception as e:
+                checks.append((None, False, e))
+        
+        # Only sections that differ need a full diff
+        diffs = {}
+        if not quiet:
+            diff_jobs = [
+                (i, (heading_section, content_for_gdoc,
+                     f"Google Doc '{file_info.heading_title}'",
+                     f"Markdown '{os.path.basename(file_info.file_path)}'"))
+                for i, (file_info, (content_for_gdoc, _), (heading_section, differs, _)) in
+                enumerate(zip(batch_files, read_results, checks)) if differs
+            ]
+            diffs = dict(zip((i for i, _ in diff_jobs), compute_unified_diffs([job for _, job in diff_jobs])))
+        
+        for i, (file_info, (heading_section, differs, error)) in enumerate(zip(batch_files, checks)):
+            file_path = file_info.file_path
+            heading_title = file_info.heading_title
+            
+            if not quiet:
+                print(f"Checking: {os.path.basename(file_path)} -> {heading_title}")
+            
+            if error is not None:
+                if not quiet:
+                    print(f"  Error processing {file_path}: {error}")
                 else:
+                    print(f"ERROR: {file_path}")
+                continue
+            
+            if heading_section:
+                if differs:
                     if not quiet:
-                        print(f"  ❌  Heading '{heading_title}' not found in Google Doc")
+                        print(f"  ⚠️  Differences found in '{heading_title}'")
+                        print_diff(diffs[i])
                     else:
-                        print(f"MISSING: {file_path}")
-                
-                if not quiet:
-                    print()
-                    
-            except Exception as e:
+                        print(f"DIFF: {file_path}")
+                else:
+                    if not quiet:
+                        print(f"  ✓  No differences in '{heading_title}'")
+            else:
                 if not quiet:
-                    print(f"  Error processing {file_path}: {e}")
+                    print(f"  ❌  Heading '{heading_title}' not found in Google Doc")
                 else:
-                    print(f"ERROR: {file_path}")
+                    print(f"MISSING: {file_path}")
+            
+            if not quiet:
+                print()
         
     except Exception as e:
         print(f'Error diffing batch: {e}', file=sys.stderr)
 
 
-def update_batch_by_name(batch_identifier: str, quiet: bool = False) -> None:
+def _read_remote_content(file_path: str) -> Tuple[Optional[str], Optional[Exception]]:
+    """Read one markdown file and return (content with frontmatter stripped, error)."""
+    try:
+        return read_markdown_file(file_path)[1], None
+    except Exception as e:
+        return None, e
+
+
+def _read_batch_section(file_info: BatchFile) -> Tuple[Optional[str], Optional[Exception]]:
+    """Read one batch file and return (markdown section with its heading, error)."""
+    # Frontmatter is stripped for Google Doc
+    content_for_gdoc, error = _read_remote_content(file_info.file_path)
+    if error is not None:
+        return None, error
+    
+    return f"# {file_info.heading_title}\n\n{content_for_gdoc}", None
+
+
+def iter_batch_entries(directory: str):
+    """
+    Yield a BatchFile for every markdown file under a directory that has batch metadata.
+    
+    Args:
+        directory (str): Directory to scan recursively
+        
+    Yields:
+        BatchFile: Entries in discovery order; unreadable files are skipped
+    """
+    for file_path, metadata in scan_markdown_frontmatter(directory):
+        batch_info = metadata.get('batch') if metadata else None
+        if isinstance(batch_info, dict):
+            yield _batch_file(file_path, batch_info)
+
+
+def _batch_matches(batch_identifier: str, entry: BatchFile) -> bool:
+    """Check whether a batch entry matches a batch ID, doc ID, or (partial) batch title."""
+    return (batch_identifier == entry.batch_id or
+            batch_identifier == entry.doc_id or
+            batch_identifier.lower() == entry.batch_title.lower() or
+            (len(batch_identifier) > 3 and batch_identifier.lower() in entry.batch_title.lower()))
+
+
+def update_batch_by_name(batch_identifier: str, quiet: bool = False,
+                         parallelism: int = DEFAULT_BATCH_PARALLELISM) -> None:
     """
     Update an existing batch by finding all files that belong to it.
     
@@ -3149,6 +3940,7 @@ def update_batch_by_name(batch_identifier: str, quiet: bool = False) -> None:
     Args:
         batch_identifier (str): Batch ID, batch title, or Google Doc ID
         quiet (bool): If True, suppress output messages
+        parallelism (int): Number of files to read concurrently
         
     Example:
         update_batch_by_name("samp")  # Batch ID
@@ -3156,44 +3948,21 @@ def update_batch_by_name(batch_identifier: str, quiet: bool = False) -> None:
         update_batch_by_name("1ABC123def456")  # Google Doc ID
     """
     try:
-        # Find all markdown files that belong to this batch
-        batch_files = []
         doc_id = None
         batch_title = None
         
-        # First pass: find the target batch
+        # Scan the tree once; the target batch and its files both come from this list
+        scanned = list(iter_batch_entries('.'))
+        
+        # Find the target batch
         target_batch_info = None
-        for root, dirs, files in os.walk('.'):
-            for file in files:
-                if file.endswith('.md'):
-                    file_path = os.path.join(root, file)
-                    try:
-                        with open(file_path, 'r', encoding='utf-8') as f:
-                            content = f.read()
-                        
-                        metadata = extract_frontmatter_metadata(content)
-                        
-                        if 'batch' in metadata and isinstance(metadata['batch'], dict):
-                            batch_info = metadata['batch']
-                            batch_doc_id = batch_info.get('doc_id', '')
-                            batch_name = batch_info.get('batch_title', '')
-                            batch_id = batch_info.get('batch_id', '')
-                            
-                            # Check if this file belongs to the specified batch
-                            # Match by batch_id, doc_id, or batch_title (exact or partial)
-                            if (batch_identifier == batch_id or
-                                batch_identifier == batch_doc_id or 
-                                batch_identifier.lower() == batch_name.lower() or
-                                (len(batch_identifier) > 3 and batch_identifier.lower() in batch_name.lower())):
-                                
-                                # Store the target batch info from first match
-                                if target_batch_info is None:
-                                    target_batch_info = batch_info
-                                    doc_id = batch_doc_id
-                                    batch_title = batch_name
-                                    
-                    except Exception:
-                        continue
+        for entry in scanned:
+            if _batch_matches(batch_identifier, entry):
+                # Store the target batch info from first match
+                target_batch_info = entry.batch_info
+                doc_id = entry.doc_id
+                batch_title = entry.batch_title
+                break
         
         if target_batch_info is None:
             if not quiet:
@@ -3202,31 +3971,8 @@ def update_batch_by_name(batch_identifier: str, quiet: bool = False) -> None:
                 list_batch_groupings('.', quiet=True)
             return
         
-        # Second pass: find all files that belong to the target batch
-        for root, dirs, files in os.walk('.'):
-            for file in files:
-                if file.endswith('.md'):
-                    file_path = os.path.join(root, file)
-                    try:
-                        with open(file_path, 'r', encoding='utf-8') as f:
-                            content = f.read()
-                        
-                        metadata = extract_frontmatter_metadata(content)
-                        
-                        if 'batch' in metadata and isinstance(metadata['batch'], dict):
-                            batch_info = metadata['batch']
-                            batch_doc_id = batch_info.get('doc_id', '')
-                            
-                            # Only include files from the target batch
-                            if batch_doc_id == doc_id:
-                                batch_files.append({
-                                    'file_path': file_path,
-                                    'heading_title': batch_info.get('heading_title', 'Unknown'),
-                                    'batch_info': batch_info
-                                })
-                                    
-                    except Exception:
-                        continue
+        # Collect all files that belong to the target batch
+        batch_files = [entry for entry in scanned if entry.doc_id == doc_id]
         
         if not batch_files:
             if not quiet:
@@ -3248,20 +3994,24 @@ def update_batch_by_name(batch_identifier: str, quiet: bool = False) -> None:
         
         # Sort files by their original order (we'll use filename as a proxy for now)
         # In a real implementation, you might want to store the original order in frontmatter
-        batch_files.sort(key=lambda x: x['file_path'])
+        batch_files.sort(key=lambda x: x.file_path)
         
         # Get credentials
-        creds = get_credentials()
-        docs_service = build('docs', 'v1', credentials=creds)
-        drive_service = build('drive', 'v3', credentials=creds)
+        docs_service, drive_service = get_google_services()
         
-        # Clear the existing document content (keep the title)
+        # Work out how to clear the existing document content (keep the title).
+        # The delete is sent in the same batchUpdate as the new content, so
+        # the insertion point is computed from the post-delete document end.
+        clear_requests = []
+        post_clear_end_index = None
         try:
-            doc = docs_service.documents().get(documentId=doc_id).execute()
+            doc = docs_service.documents().get(documentId=doc_id, fields=DOC_EXTENT_FIELDS).execute(num_retries=READ_RETRIES)
             doc_title = doc.get('title', 'Unknown')
             
             # Delete all content except the first paragraph (which contains the title)
             body_content = doc.get('body', {}).get('content', [])
+            if body_content:
+                post_clear_end_index = body_content[-1].get('endIndex', 1)
             if len(body_content) > 1:
                 # Delete everything after the first paragraph
                 # Find the last element that's not just a newline
@@ -3280,202 +4030,196 @@ def update_batch_by_name(batch_identifier: str, quiet: bool = False) -> None:
                 if end_index > 1:
                     end_index = end_index - 1
                 
-                delete_requests = [{
-                    'deleteContentRange': {
-                        'range': {
-                            'startIndex': body_content[1].get('startIndex', 1),
-                            'endIndex': end_index
+                start_index = body_content[1].get('startIndex', 1)
+                if end_index > start_index:
+                    clear_requests.append({
+                        'deleteContentRange': {
+                            'range': {
+                                'startIndex': start_index,
+                                'endIndex': end_index
+                            }
                         }
-                    }
-                }]
-                
-                docs_service.documents().batchUpdate(
-                    documentId=doc_id,
-                    body={'requests': delete_requests}
-                ).execute()
+                    })
+                    post_clear_end_index -= end_index - start_index
                 
         except Exception as e:
             if not quiet:
                 print(f"Warning: Could not clear existing content: {e}")
         
-        # Now add each file as a heading section in order
-        for i, file_info in enumerate(batch_files):
-            file_path = file_info['file_path']
-            heading_title = file_info['heading_title']
+        # Read every file concurrently, then combine them in batch order,
+        # each under its own heading
+        with ThreadPoolExecutor(max_workers=max(1, min(parallelism, len(batch_files)))) as executor:
+            read_results = list(executor.map(_read_batch_section, batch_files))
+        
+        sections = []
+        progress = ProgressThrottle(len(batch_files))
+        for i, (file_info, (section, error)) in enumerate(zip(batch_files, read_results)):
+            file_path = file_info.file_path
             
-            if not quiet:
-                print(f"  Processing {i+1}/{len(batch_files)}: {os.path.basename(file_path)} -> {heading_title}")
+            if not quiet and progress.due(i):
+                print(f"  Processing {i+1}/{len(batch_files)}: {os.path.basename(file_path)} -> {file_info.heading_title}")
+            
+            if error is not None:
+                if not quiet:
+                    print(f"    Error processing {file_path}: {error}")
+                continue
             
+            sections.append(section)
+        
+        if sections:
             try:
-                # Read markdown file
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    markdown_content = f.read()
-                
-                # Extract metadata
-                metadata = extract_frontmatter_metadata(markdown_content)
+                # Convert the combined markdown to Google Doc format in one temporary
+                # document, uploading straight from memory
+                media = markdown_upload('\n\n'.join(sections))
                 
-                # Strip frontmatter for Google Doc
-                content_for_gdoc = strip_frontmatter_for_remote_sync(markdown_content)
+                file_metadata = {
+                    'mimeType': 'application/vnd.google-apps.document'
+                }
                 
-                # Create a temporary markdown file with the heading
-                temp_file_path = f"{file_path}.temp_batch_update"
-                with open(temp_file_path, 'w', encoding='utf-8') as f:
-                    f.write(f"# {heading_title}\n\n{content_for_gdoc}")
+                temp_doc = execute_with_backoff(docs_service.documents().create(body={'title': 'temp_batch_update'}))
+                temp_doc_id = temp_doc['documentId']
                 
                 try:
-                    # Convert markdown to Google Doc format using Drive API
-                    media = MediaFileUpload(
-                        temp_file_path,
-                        mimetype='text/markdown',
-                        resumable=True
-                    )
-                    
-                    file_metadata = {
-                        'mimeType': 'application/vnd.google-apps.document'
-                    }
-                    
-                    # Create a temporary document with converted content
-                    temp_doc = docs_service.documents().create(body={'title': f'temp_batch_update_{i}'}).execute()
-                    temp_doc_id = temp_doc['documentId']
-                    
-                    # Update the temporary doc with converted content
-                    drive_service.files().update(
+                    execute_with_backoff(drive_service.files().update(
                         fileId=temp_doc_id,
                         media_body=media,
                         body=file_metadata
-                    ).execute()
+                    ))
                     
                     # Get the converted content
-                    temp_doc_content = docs_service.documents().get(documentId=temp_doc_id).execute()
+                    temp_doc_content = docs_service.documents().get(documentId=temp_doc_id, fields=DOC_TEXT_FIELDS).execute(num_retries=READ_RETRIES)
                     
-                    # Get current document content to find insertion point
-                    current_doc = docs_service.documents().get(documentId=doc_id).execute()
-                    insert_position = max(1, current_doc.get('body', {}).get('content', [{}])[-1].get('endIndex', 1) - 1)
+                    # Find the insertion point, fetching the document end only if the
+                    # clear step couldn't read it
+                    if post_clear_end_index is None:
+                        current_doc = docs_service.documents().get(documentId=doc_id, fields=DOC_END_FIELDS).execute(num_retries=READ_RETRIES)
+                        current_content = (current_doc.get('body') or EMPTY_DICT).get('content') or [EMPTY_DICT]
+                        post_clear_end_index = current_content[-1].get('endIndex', 1)
+                    insert_position = max(1, post_clear_end_index - 1)
                     
                     # Copy content from temp doc to main doc
                     body_content = temp_doc_content.get('body', {}).get('content', [])
                     
-                    # First, insert all text content at once to avoid index issues
-                    all_text = ''
-                    for element in body_content:
-                        if 'paragraph' in element:
-                            para = element['paragraph']
-                            for text_run in para.get('elements', []):
-                                if 'textRun' in text_run:
-                                    all_text += text_run['textRun'].get('content', '')
+                    all_text = ''.join(
+                        text_run['textRun'].get('content', '')
+                        for element in body_content if 'paragraph' in element
+                        for text_run in element['paragraph'].get('elements', []) if 'textRun' in text_run
+                    )
                     
-                    # Insert all text at once
+                    # Clear the old content, insert all text and apply its formatting
+                    # in a single batch
                     if all_text.strip():
-                        docs_service.documents().batchUpdate(
-                            documentId=doc_id,
-                            body={'requests': [{
-                                'insertText': {
-                                    'location': {
-                                        'index': insert_position
-                                    },
-                                    'text': all_text
-                                }
-                            }]}
-                        ).execute()
+                        requests = clear_requests + [{
+                            'insertText': {
+                                'location': {
+                                    'index': insert_position
+                                },
+                                'text': all_text
+                            }
+                        }]
                         
-                        # Now apply formatting in a separate batch
-                        requests = []
+                        heading_styles = ('HEADING_1', 'HEADING_2', 'HEADING_3', 'HEADING_4', 'HEADING_5', 'HEADING_6')
                         current_position = insert_position
                         
+                        # Contiguous text with the same (bold, italic) style, flushed
+                        # as one updateTextStyle request when the style changes.
+                        # Unstyled text keeps the default style, so it needs no request.
+                        region_start = region_end = insert_position
+                        region_style = (False, False)
+                        last_heading = None
+                        
+                        def flush_region():
+                            if region_end > region_start and any(region_style):
+                                requests.append({
+                                    'updateTextStyle': {
+                                        'range': {
+                                            'startIndex': region_start,
+                                            'endIndex': region_end
+                                        },
+                                        'textStyle': {
+                                            'bold': region_style[0],
+                                            'italic': region_style[1]
+                                        },
+                                        'fields': 'bold,italic'
+                                    }
+                                })
+                        
                         for element in body_content:
-                            if 'paragraph' in element:
-                                para = element['paragraph']
-                                
-                                # Extract text content
-                                text = ''
-                                for text_run in para.get('elements', []):
-                                    if 'textRun' in text_run:
-                                        text += text_run['textRun'].get('content', '')
-                                
-                                if text.strip():  # Only process non-empty paragraphs
-                                    # Apply paragraph style if it exists
-                                    if 'paragraphStyle' in para and 'namedStyleType' in para['paragraphStyle']:
-                                        style_type = para['paragraphStyle']['namedStyleType']
-                                        if style_type in ['HEADING_1', 'HEADING_2', 'HEADING_3', 'HEADING_4', 'HEADING_5', 'HEADING_6']:
-                                            requests.append({
-                                                'updateParagraphStyle': {
-                                                    'range': {
-                                                        'startIndex': current_position,
-                                                        'endIndex': current_position + len(text)
-                                                    },
-                                                    'paragraphStyle': {
-                                                        'namedStyleType': style_type
-                                                    },
-                                                    'fields': 'namedStyleType'
-                                                }
-                                            })
-                                    
-                                    # Apply text formatting for each text run
-                                    text_start = current_position
-                                    for text_run in para.get('elements', []):
-                                        if 'textRun' in text_run:
-                                            run_text = text_run['textRun'].get('content', '')
-                                            run_length = len(run_text)
-                                            
-                                            if 'textStyle' in text_run['textRun']:
-                                                text_style = text_run['textRun']['textStyle']
-                                                
-                                                # Apply bold formatting
-                                                if text_style.get('bold'):
-                                                    requests.append({
-                                                        'updateTextStyle': {
-                                                            'range': {
-                                                                'startIndex': text_start,
-                                                                'endIndex': text_start + run_length
-                                                            },
-                                                            'textStyle': {
-                                                                'bold': True
-                                                            },
-                                                            'fields': 'bold'
-                                                        }
-                                                    })
-                                                
-                                                # Apply italic formatting
-                                                if text_style.get('italic'):
-                                                    requests.append({
-                                                        'updateTextStyle': {
-                                                            'range': {
-                                                                'startIndex': text_start,
-                                                                'endIndex': text_start + run_length
-                                                            },
-                                                            'textStyle': {
-                                                                'italic': True
-                                                            },
-                                                            'fields': 'italic'
-                                                        }
-                                                    })
-                                            
-                                            text_start += run_length
-                                    
-                                    current_position += len(text)
+                            if 'paragraph' not in element:
+                                continue
+                            para = element['paragraph']
+                            
+                            text_runs = [text_run['textRun'] for text_run in para.get('elements', []) if 'textRun' in text_run]
+                            text_length = sum(len(run.get('content', '')) for run in text_runs)
+                            
+                            style_type = (para.get('paragraphStyle') or EMPTY_DICT).get('namedStyleType')
+                            if style_type not in heading_styles or not any(run.get('content', '').strip() for run in text_runs):
+                                last_heading = None
+                            elif (last_heading is not None and
+                                  last_heading['paragraphStyle']['namedStyleType'] == style_type and
+                                  last_heading['range']['endIndex'] == current_position):
+                                # Directly follows a heading of the same level: widen its range
+                                last_heading['range']['endIndex'] += text_length
+                            else:
+                                requests.append({
+                                    'updateParagraphStyle': {
+                                        'range': {
+                                            'startIndex': current_position,
+                                            'endIndex': current_position + text_length
+                                        },
+                                        'paragraphStyle': {
+                                            'namedStyleType': style_type
+                                        },
+                                        'fields': 'namedStyleType'
+                                    }
+                                })
+                                last_heading = requests[-1]['updateParagraphStyle']
+                            
+                            for run in text_runs:
+                                run_length = len(run.get('content', ''))
+                                if not run_length:
+                                    continue
+                                text_style = run.get('textStyle') or EMPTY_DICT
+                                style = (bool(text_style.get('bold')), bool(text_style.get('italic')))
+                                if style != region_style:
+                                    flush_region()
+                                    region_start, region_style = region_end, style
+                                region_end += run_length
+                            
+                            # Empty paragraphs still occupy their newline in the inserted text
+                            current_position += text_length
                         
-                        # Execute formatting requests
-                        if requests:
-                            docs_service.documents().batchUpdate(
-                                documentId=doc_id,
-                                body={'requests': requests}
-                            ).execute()
-                    
-                    # Clean up temporary document
-                    drive_service.files().delete(fileId=temp_doc_id).execute()
-                    
-                    if not quiet:
-                        print(f"    ✓ Updated heading: {heading_title}")
-                    
-                finally:
-                    # Clean up temporary file
-                    if os.path.exists(temp_file_path):
-                        os.remove(temp_file_path)
+                        flush_region()
                         
+                        execute_with_backoff(docs_service.documents().batchUpdate(
+                            documentId=doc_id,
+                            body={'requests': requests}
+                        ))
+                    elif clear_requests:
+                        execute_with_backoff(docs_service.documents().batchUpdate(
+                            documentId=doc_id,
+                            body={'requests': clear_requests}
+                        ))
+                finally:
+                    # Clean up temporary document
+                    execute_with_backoff(drive_service.files().delete(fileId=temp_doc_id))
+                
+                if not quiet:
+                    print(f"    ✓ Updated {len(sections)} heading sections")
+                
             except Exception as e:
                 if not quiet:
-                    print(f"    Error processing {file_path}: {e}")
-                continue
+                    print(f"    Error updating batch content: {e}")
+        elif clear_requests:
+            # Nothing to insert, but the old content still goes
+            try:
+                execute_with_backoff(docs_service.documents().batchUpdate(
+                    documentId=doc_id,
+                    body={'requests': clear_requests}
+                ))
+            except Exception as e:
+                if not quiet:
+                    print(f"Warning: Could not clear existing content: {e}")
         
         if not quiet:
             print(f"✓ Batch update completed")
@@ -3487,75 +4231,47 @@ def update_batch_by_name(batch_identifier: str, quiet: bool = False) -> None:
         print(f'Error updating batch: {e}', file=sys.stderr)
 
 
-def find_heading_section_in_gdoc(doc: dict, heading_title: str) -> str:
+def build_heading_section_map(doc: dict) -> dict:
     """
-    Find a heading section in a Google Doc and return its content.
+    Index every HEADING_1 section of a Google Doc in a single pass.
     
     Args:
         doc (dict): Google Doc document object
-        heading_title (str): Title of the heading to find
         
     Returns:
-        str: Content of the heading section, or empty string if not found
+        dict: {lowercased heading text: (start_index, end_index, section_text)}
+              in document order; section_text is stripped of surrounding whitespace
     """
-    try:
-        content = doc.get('body', {}).get('content', [])
-        
-        # Find the target heading
-        heading_start = None
-        heading_end = None
-        
-        for element in content:
-            if 'paragraph' in element:
-                para = element['paragraph']
-                if 'paragraphStyle' in para:
-                    style = para['paragraphStyle']
-                    if 'namedStyleType' in style and style['namedStyleType'] == 'HEADING_1':
-                        # Extract text from the paragraph
-                        text = ''
-                        for text_run in para.get('elements', []):
-                            if 'textRun' in text_run:
-                                text += text_run['textRun'].get('content', '')
-                        
-                        if heading_title.lower() in text.lower():
-                            heading_start = element.get('endIndex', 0)
-                            break
-        
-        if heading_start is None:
-            return ""
-        
-        # Find the end of the heading section (next H1 heading or end of document)
-        for element in content:
-            if element.get('startIndex', 0) > heading_start:
-                if 'paragraph' in element:
-                    para = element['paragraph']
-                    if 'paragraphStyle' in para:
-                        style = para['paragraphStyle']
-                        if 'namedStyleType' in style and style['namedStyleType'] == 'HEADING_1':
-                            heading_end = element.get('startIndex', 0)
-                            break
-        
-        if heading_end is None:
-            # Use end of document
-            heading_end = content[-1].get('endIndex', 0)
+    heading_map = {}
+    content = (doc.get('body') or EMPTY_DICT).get('content') or []
+    
+    current_key = None
+    current_start = 0
+    current_text = None
+    
+    for element in content:
+        para = element.get('paragraph')
+        if para is None:
+            continue
         
-        # Extract the content between heading_start and heading_end
-        section_content = ""
-        for element in content:
-            start_idx = element.get('startIndex', 0)
-            end_idx = element.get('endIndex', 0)
+        if (para.get('paragraphStyle') or EMPTY_DICT).get('namedStyleType') == 'HEADING_1':
+            if current_key is not None and current_key not in heading_map:
+                heading_map[current_key] = (current_start, element.get('startIndex', 0), current_text.getvalue().strip())
             
-            if start_idx >= heading_start and end_idx <= heading_end:
-                if 'paragraph' in element:
-                    para = element['paragraph']
-                    for text_run in para.get('elements', []):
-                        if 'textRun' in text_run:
-                            section_content += text_run['textRun'].get('content', '')
-        
-        return section_content.strip()
-        
-    except Exception:
-        return ""
+            title = ''.join(text_run['textRun'].get('content', '')
+                            for text_run in para.get('elements', []) if 'textRun' in text_run)
+            current_key = title.strip().lower()
+            current_start = element.get('endIndex', 0)
+            current_text = io.StringIO()
+        elif current_key is not None:
+            for text_run in para.get('elements', []):
+                if 'textRun' in text_run:
+                    current_text.write(text_run['textRun'].get('content', ''))
+    
+    if current_key is not None and current_key not in heading_map:
+        heading_map[current_key] = (current_start, content[-1].get('endIndex', 0), current_text.getvalue().strip())
+    
+    return heading_map
 
 
 def list_batch_groupings(directory: str, quiet: bool = False) -> None:
@@ -3576,14 +4292,11 @@ def list_batch_groupings(directory: str, quiet: bool = False) -> None:
     try:
         from collections import defaultdict
         
-        # Find all markdown files
-        markdown_files = []
-        for root, dirs, files in os.walk(directory):
-            for file in files:
-                if file.endswith('.md'):
-                    markdown_files.append(os.path.join(root, file))
+        # Find all markdown files and parse their frontmatter
+        read_errors = {}
+        scanned = scan_markdown_frontmatter(directory, errors=read_errors)
         
-        if not markdown_files:
+        if not scanned:
             if not quiet:
                 print("No markdown files found in directory")
             return
@@ -3592,27 +4305,17 @@ def list_batch_groupings(directory: str, quiet: bool = False) -> None:
         batch_groups = defaultdict(list)
         ungrouped_files = []
         
-        for file_path in markdown_files:
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                
-                metadata = extract_frontmatter_metadata(content)
-                
-                if 'batch' in metadata and isinstance(metadata['batch'], dict):
-                    batch_info = metadata['batch']
-                    batch_id = batch_info.get('batch_id', 'unknown')
-                    batch_groups[batch_id].append({
-                        'file': file_path,
-                        'batch_info': batch_info
-                    })
-                else:
-                    ungrouped_files.append(file_path)
-                    
-            except Exception as e:
+        for file_path, metadata in scanned:
+            if metadata is None:
                 if not quiet:
-                    print(f"Warning: Could not read {file_path}: {e}")
+                    print(f"Warning: Could not read {file_path}: {read_errors.get(file_path)}")
                 continue
+            
+            if isinstance(metadata.get('batch'), dict):
+                batch_info = metadata['batch']
+                batch_groups[batch_info.get('batch_id', 'unknown')].append(_batch_file(file_path, batch_info))
+            else:
+                ungrouped_files.append(file_path)
         
         if not quiet:
             print(f"Batch Groupings in {directory}")
@@ -3621,7 +4324,7 @@ def list_batch_groupings(directory: str, quiet: bool = False) -> None:
             if batch_groups:
                 for batch_id, files in batch_groups.items():
                     # Get batch info from first file
-                    batch_info = files[0]['batch_info']
+                    batch_info = files[0].batch_info
                     batch_title = batch_info.get('batch_title', 'Unknown Title')
                     doc_id = batch_info.get('doc_id', 'Unknown')
                     
@@ -3632,8 +4335,8 @@ def list_batch_groupings(directory: str, quiet: bool = False) -> None:
                     print(f"  Files ({len(files)}):")
                     
                     for file_info in files:
-                        file_path = file_info['file']
-                        heading_title = file_info['batch_info'].get('heading_title', 'Unknown')
+                        file_path = file_info.file_path
+                        heading_title = file_info.heading_title
                         print(f"    - {os.path.basename(file_path)} -> {heading_title}")
             else:
                 print("No batch groupings found")
@@ -3645,7 +4348,7 @@ def list_batch_groupings(directory: str, quiet: bool = False) -> None:
         
         if quiet:
             for batch_id, files in batch_groups.items():
-                batch_info = files[0]['batch_info']
+                batch_info = files[0].batch_info
                 doc_id = batch_info.get('doc_id', '')
                 if doc_id:
                     print(f"https://docs.google.com/document/d/{doc_id}/edit")
@@ -3654,6 +4357,10 @@ def list_batch_groupings(directory: str, quiet: bool = False) -> None:
         print(f'Error listing batch groupings: {e}', file=sys.stderr)
 
 
+# Heading or tab fragments, matched in a single scan of the URL
+_TAB_URL_RE = re.compile(r'#heading=|\?tab=')
+
+
 def is_tab_url(url: str) -> bool:
     """
     Check if a Google Doc URL is a tab URL (contains heading fragment).
@@ -3671,9 +4378,7 @@ def is_tab_url(url: str) -> bool:
         is_tab_url("https://docs.google.com/document/d/123/edit#heading=h.abc")
         # Returns: True
     """
-    if not url:
-        return False
-    return '#heading=' in url or '?tab=' in url
+    return bool(url) and _TAB_URL_RE.search(url) is not None
 
 
 def extract_tab_title_from_url(url: str) -> str:
@@ -3710,45 +4415,84 @@ def extract_tab_title_from_url(url: str) -> str:
     return None
 
 
-def main():
+_SOURCE_REQUIRED_HELP = (
+    "Error: Source is required\n"
+    "Use: mdsync <source> [destination] or mdsync list [file_or_directory]\n"
+    "Run 'mdsync --help' for more information\n"
+)
+
+_DIFF_HELP = (
+    "Error: --diff requires both source and destination\n"
+    "Supported diff combinations:\n"
+    "  markdown_file google_doc_url --diff\n"
+    "  google_doc_url markdown_file --diff\n"
+    "  markdown_file confluence:SPACE/PAGE_ID --diff\n"
+    "  confluence:SPACE/PAGE_ID markdown_file --diff\n"
+)
+
+
+_MAIN_EPILOG = (
+    'Examples:\n'
+    '  # Google Docs\n'
+    '  %(prog)s https://docs.google.com/document/d/DOC_ID/edit output.md\n'
+    '  %(prog)s input.md DOC_ID\n'
+    '  %(prog)s input.md --create\n'
+    '  %(prog)s input.md --create -u | pbcopy\n'
+    '  %(prog)s DOC_ID --list-revisions\n'
+    '  %(prog)s DOC_ID --list-comments\n'
+    '  %(prog)s DOC_ID --lock\n\n'
+    '  # Batch Document Management\n'
+    '  %(prog)s --batch file1.md file2.md file3.md\n'
+    '  %(prog)s --batch file1.md file2.md --batch-title "Project Documentation"\n'
+    '  %(prog)s --batch file1.md file2.md --batch-headers --batch-horizontal-sep --batch-toc\n'
+    '  %(prog)s DIRECTORY --list-batch\n'
+    '  %(prog)s DOC_ID --diff-batch\n'
+    '  %(prog)s BATCH_ID --batch-update\n'
+    '  %(prog)s "Batch Title" --batch-update\n\n'
+    '  # Confluence\n'
+    '  %(prog)s input.md confluence:SPACE/123456\n'
+    '  %(prog)s input.md --create-confluence --space ENG --title "My Page"\n'
+    '  %(prog)s confluence:SPACE/123456 output.md\n'
+    '  %(prog)s https://site.atlassian.net/wiki/spaces/ENG/pages/123456 output.md\n\n'
+    '  # Push/pull (uses frontmatter URLs)\n'
+    '  %(prog)s push file.md  # Push local → remote\n'
+    '  %(prog)s pull file.md  # Pull remote → local\n\n'
+    '  # List frontmatter\n'
+    '  %(prog)s list [file_or_directory]\n'
+    '  %(prog)s list --check-status  # Check live frozen status\n'
+    '  %(prog)s list --check-status --diff  # Check sync status summary\n'
+    '  %(prog)s list --format json   # JSON output\n\n'
+    '  # Diff (dry run)\n'
+    '  %(prog)s file.md gdoc_url --diff\n'
+    '  %(prog)s gdoc_url file.md --diff\n'
+    '  %(prog)s file.md confluence:SPACE/123 --diff\n\n'
+    '  # Intelligent destination detection\n'
+    '  %(prog)s file.md  # Auto-detect from frontmatter'
+)
+
+
+# Source-only operations, in main()'s dispatch order: (flags, required source kind, error)
+_SOURCE_KIND_REQUIREMENTS = (
+    (('lock', 'unlock', 'lock_status'), 'gdoc', "Lock operations only work with Google Docs"),
+    (('list_comments',), 'gdoc', "--list-comments only works with Google Docs"),
+    (('list_revisions',), 'gdoc', "--list-revisions only works with Google Docs"),
+    (('lock_confluence', 'unlock_confluence', 'confluence_lock_status'), 'confluence',
+     "Source must be a Confluence page for lock operations"),
+    (('diff_batch',), 'gdoc', "--diff-batch only works with Google Docs"),
+)
+
+# Operations main() dispatches before the Google Doc/Confluence -> markdown exports
+_PRE_EXPORT_FLAGS = tuple(flag for flags, _, _ in _SOURCE_KIND_REQUIREMENTS for flag in flags) + (
+    'list_batch', 'batch_update', 'diff',
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the main command-line parser; built once and reused."""
     parser = argparse.ArgumentParser(
         description='Sync between Google Docs, Confluence, and Markdown files',
-        epilog='Examples:\n'
-               '  # Google Docs\n'
-               '  %(prog)s https://docs.google.com/document/d/DOC_ID/edit output.md\n'
-               '  %(prog)s input.md DOC_ID\n'
-               '  %(prog)s input.md --create\n'
-               '  %(prog)s input.md --create -u | pbcopy\n'
-               '  %(prog)s DOC_ID --list-revisions\n'
-               '  %(prog)s DOC_ID --list-comments\n'
-               '  %(prog)s DOC_ID --lock\n\n'
-               '  # Batch Document Management\n'
-               '  %(prog)s --batch file1.md file2.md file3.md\n'
-               '  %(prog)s --batch file1.md file2.md --batch-title "Project Documentation"\n'
-               '  %(prog)s --batch file1.md file2.md --batch-headers --batch-horizontal-sep --batch-toc\n'
-               '  %(prog)s DIRECTORY --list-batch\n'
-               '  %(prog)s DOC_ID --diff-batch\n'
-               '  %(prog)s BATCH_ID --batch-update\n'
-               '  %(prog)s "Batch Title" --batch-update\n\n'
-               '  # Confluence\n'
-               '  %(prog)s input.md confluence:SPACE/123456\n'
-               '  %(prog)s input.md --create-confluence --space ENG --title "My Page"\n'
-               '  %(prog)s confluence:SPACE/123456 output.md\n'
-               '  %(prog)s https://site.atlassian.net/wiki/spaces/ENG/pages/123456 output.md\n\n'
-               '  # Push/pull (uses frontmatter URLs)\n'
-               '  %(prog)s push file.md  # Push local → remote\n'
-               '  %(prog)s pull file.md  # Pull remote → local\n\n'
-               '  # List frontmatter\n'
-               '  %(prog)s list [file_or_directory]\n'
-               '  %(prog)s list --check-status  # Check live frozen status\n'
-               '  %(prog)s list --check-status --diff  # Check sync status summary\n'
-               '  %(prog)s list --format json   # JSON output\n\n'
-               '  # Diff (dry run)\n'
-               '  %(prog)s file.md gdoc_url --diff\n'
-               '  %(prog)s gdoc_url file.md --diff\n'
-               '  %(prog)s file.md confluence:SPACE/123 --diff\n\n'
-               '  # Intelligent destination detection\n'
-               '  %(prog)s file.md  # Auto-detect from frontmatter',
+        epilog=_MAIN_EPILOG,
         formatter_class=argparse.RawDescriptionHelpFormatter
     )
     
@@ -3757,29 +4501,32 @@ def main():
     parser.add_argument('destination', nargs='?', 
                        help='Destination: Google Doc URL/ID, Confluence page, or Markdown file')
     
+    # Operations that act on the source alone; only one may be given
+    operations = parser.add_mutually_exclusive_group()
+    
     # Google Docs options
     parser.add_argument('--create', action='store_true',
                        help='Create a new Google Doc (use with markdown source)')
-    parser.add_argument('--list-revisions', action='store_true',
-                       help='List revision history for a Google Doc')
-    parser.add_argument('--lock', action='store_true',
-                       help='Lock a Google Doc to prevent editing')
-    parser.add_argument('--unlock', action='store_true',
-                       help='Unlock a Google Doc to allow editing')
-    parser.add_argument('--lock-status', action='store_true',
-                       help='Check if a Google Doc is locked')
+    operations.add_argument('--list-revisions', action='store_true',
+                           help='List revision history for a Google Doc')
+    operations.add_argument('--lock', action='store_true',
+                           help='Lock a Google Doc to prevent editing')
+    operations.add_argument('--unlock', action='store_true',
+                           help='Unlock a Google Doc to allow editing')
+    operations.add_argument('--lock-status', action='store_true',
+                           help='Check if a Google Doc is locked')
     parser.add_argument('--lock-reason', type=str, metavar='REASON',
                        help='Reason for locking (use with --lock)')
     
     # Confluence lock options
-    parser.add_argument('--lock-confluence', action='store_true',
-                       help='Lock a Confluence page (restrict editing to allowed editors from secrets.yaml)')
-    parser.add_argument('--unlock-confluence', action='store_true',
-                       help='Unlock a Confluence page (remove all edit restrictions)')
-    parser.add_argument('--confluence-lock-status', action='store_true',
-                       help='Check if a Confluence page is locked')
-    parser.add_argument('--list-comments', action='store_true',
-                       help='List all comments from a Google Doc')
+    operations.add_argument('--lock-confluence', action='store_true',
+                           help='Lock a Confluence page (restrict editing to allowed editors from secrets.yaml)')
+    operations.add_argument('--unlock-confluence', action='store_true',
+                           help='Unlock a Confluence page (remove all edit restrictions)')
+    operations.add_argument('--confluence-lock-status', action='store_true',
+                           help='Check if a Confluence page is locked')
+    operations.add_argument('--list-comments', action='store_true',
+                           help='List all comments from a Google Doc')
     parser.add_argument('--unresolved-only', action='store_true',
                        help='Show only unresolved comments (use with --list-comments)')
     
@@ -3800,12 +4547,12 @@ def main():
     # Heading management options
     parser.add_argument('--create-empty', action='store_true',
                        help='Create empty Google Doc')
-    parser.add_argument('--list-batch', action='store_true',
-                       help='List all batch groupings in markdown files')
-    parser.add_argument('--diff-batch', action='store_true',
-                       help='Diff entire batch against Google Doc (use with batch document ID)')
-    parser.add_argument('--batch-update', action='store_true',
-                       help='Update existing batch by finding all files in current directory (use with batch ID, title, or doc ID)')
+    operations.add_argument('--list-batch', action='store_true',
+                           help='List all batch groupings in markdown files')
+    operations.add_argument('--diff-batch', action='store_true',
+                           help='Diff entire batch against Google Doc (use with batch document ID)')
+    operations.add_argument('--batch-update', action='store_true',
+                           help='Update existing batch by finding all files in current directory (use with batch ID, title, or doc ID)')
     parser.add_argument('--batch', nargs='+', metavar='MARKDOWN_FILE',
                        help='Create a new Google Doc with multiple markdown files as headings (simple client-side combination)')
     parser.add_argument('--batch-title', type=str, metavar='TITLE',
@@ -3816,6 +4563,8 @@ def main():
                        help='Add horizontal separators between files in the batch document (default: no separators)')
     parser.add_argument('--batch-toc', action='store_true',
                        help='Generate and include a table of contents for H1 headings in the batch document')
+    parser.add_argument('--batch-parallelism', type=int, default=DEFAULT_BATCH_PARALLELISM, metavar='N',
+                       help=f'Number of files to read concurrently for --diff-batch and --batch-update (default: {DEFAULT_BATCH_PARALLELISM})')
     
     # General options
     parser.add_argument('-u', '--url-only', action='store_true',
@@ -3830,187 +4579,202 @@ def main():
     parser.add_argument('--version', action='version', version='mdsync 0.3.2',
                        help='Show version information and exit')
     
-    # Handle list command (special case) - check before parsing main args
-    import sys
-    if len(sys.argv) > 1 and sys.argv[1] == 'list':
-        # Parse list command arguments manually
-        list_args = sys.argv[2:]  # Skip 'mdsync' and 'list'
-        
-        # Parse list arguments
-        list_parser = argparse.ArgumentParser()
-        list_parser.add_argument('path', nargs='?', default='.', 
-                               help='File or directory to scan (default: current directory)')
-        list_parser.add_argument('--format', type=str, choices=['text', 'json'], default='text',
-                               help='Output format: text or json (default: text)')
-        list_parser.add_argument('--check-status', action='store_true',
-                               help='Check live frozen status of destinations (requires credentials)')
-        list_parser.add_argument('--diff', action='store_true',
-                               help='Show sync status summary for each destination (markdown vs remote)')
-        list_parser.add_argument('--secrets-file', type=str, metavar='PATH',
-                               help='Path to secrets.yaml file (default: searches in current dir, ~/.config/mdsync/, ~/.mdsync/)')
-        
-        try:
-            list_args_parsed = list_parser.parse_args(list_args)
-            secrets_file_path = list_args_parsed.secrets_file if hasattr(list_args_parsed, 'secrets_file') and list_args_parsed.secrets_file else None
-            list_markdown_files(list_args_parsed.path, list_args_parsed.format, list_args_parsed.check_status, list_args_parsed.diff, secrets_file_path)
-            return
-        except SystemExit:
-            return
-
-    # Handle push command (local markdown → remote)
-    if len(sys.argv) > 1 and sys.argv[1] == 'push':
-        push_pull_args = sys.argv[2:]
-        pp_parser = argparse.ArgumentParser(prog='mdsync push')
-        pp_parser.add_argument('file', help='Markdown file to push')
-        pp_parser.add_argument('--secrets-file', type=str, metavar='PATH',
-                               help='Path to secrets.yaml file')
-        try:
-            pp = pp_parser.parse_args(push_pull_args)
-        except SystemExit:
-            return
+    return parser
 
-        markdown_path = pp.file
-        secrets_file_path = pp.secrets_file if pp.secrets_file else None
 
-        try:
-            with open(markdown_path, 'r', encoding='utf-8') as f:
-                markdown_content = f.read()
-        except FileNotFoundError:
-            print(f"Error: File not found: {markdown_path}", file=sys.stderr)
-            sys.exit(1)
+@functools.lru_cache(maxsize=1)
+def _build_list_parser() -> argparse.ArgumentParser:
+    """Build the parser for the 'list' subcommand; built once and reused."""
+    list_parser = argparse.ArgumentParser(prog='mdsync list')
+    list_parser.add_argument('path', nargs='?', default='.', 
+                           help='File or directory to scan (default: current directory)')
+    list_parser.add_argument('--format', type=str, choices=['text', 'json'], default='text',
+                           help='Output format: text or json (default: text)')
+    list_parser.add_argument('--check-status', action='store_true',
+                           help='Check live frozen status of destinations (requires credentials)')
+    list_parser.add_argument('--diff', action='store_true',
+                           help='Show sync status summary for each destination (markdown vs remote)')
+    list_parser.add_argument('--secrets-file', type=str, metavar='PATH',
+                           help='Path to secrets.yaml file (default: searches in current dir, ~/.config/mdsync/, ~/.mdsync/)')
+    return list_parser
 
-        fm = extract_frontmatter_metadata(markdown_content)
-        gdoc_url = fm.get('gdoc_url')
-        confluence_url = fm.get('confluence_url')
 
-        if not gdoc_url and not confluence_url:
-            print("Error: No remote URL found in frontmatter (gdoc_url or confluence_url required)", file=sys.stderr)
-            sys.exit(1)
+def _run_list_command(list_args: list) -> None:
+    """Parse 'list' subcommand arguments and list frontmatter for markdown files."""
+    try:
+        list_args_parsed = _build_list_parser().parse_args(list_args)
+    except SystemExit:
+        return
+    
+    list_markdown_files(list_args_parsed.path, list_args_parsed.format, list_args_parsed.check_status,
+                        list_args_parsed.diff, list_args_parsed.secrets_file or None)
 
-        # Determine which destinations to push to
-        destinations = []
-        if gdoc_url:
-            destinations.append(('gdoc', gdoc_url))
-        if confluence_url:
-            destinations.append(('confluence', confluence_url))
-
-        if len(destinations) > 1:
-            print("Multiple destinations found in frontmatter:")
-            for i, (platform, url) in enumerate(destinations, 1):
-                print(f"  {i}. {platform.title()}: {url}")
-            try:
-                choice = input("Choose destination (1-{}): ".format(len(destinations)))
-                choice_idx = int(choice) - 1
-                if 0 <= choice_idx < len(destinations):
-                    destinations = [destinations[choice_idx]]
-                else:
-                    print("Invalid choice", file=sys.stderr)
-                    sys.exit(1)
-            except (ValueError, KeyboardInterrupt):
-                print("Cancelled", file=sys.stderr)
-                sys.exit(1)
 
-        for platform, url in destinations:
-            if platform == 'gdoc':
-                doc_id = extract_doc_id_from_url(url) or extract_doc_id(url)
-                if not doc_id:
-                    print(f"Error: Could not extract Google Doc ID from: {url}", file=sys.stderr)
-                    sys.exit(1)
-                creds = get_credentials()
-                print(f"Pushing {markdown_path} to Google Doc...")
-                import_markdown_to_gdoc(markdown_path, doc_id, creds)
-                print(f"Done. {url}")
-            elif platform == 'confluence':
-                parsed = parse_confluence_destination(url)
-                page_id = parsed.get('page_id')
-                if not page_id:
-                    print(f"Error: Could not extract Confluence page ID from: {url}", file=sys.stderr)
-                    sys.exit(1)
-                confluence = get_confluence_client(secrets_file_path)
-                print(f"Pushing {markdown_path} to Confluence page {page_id}...")
-                import_markdown_to_confluence(markdown_path, page_id, confluence)
-                print(f"Done. {url}")
+def _run_push_command(push_pull_args: list) -> None:
+    """Parse 'push' subcommand arguments and push a markdown file to its frontmatter destination."""
+    pp_parser = argparse.ArgumentParser(prog='mdsync push')
+    pp_parser.add_argument('file', help='Markdown file to push')
+    pp_parser.add_argument('--secrets-file', type=str, metavar='PATH',
+                           help='Path to secrets.yaml file')
+    try:
+        pp = pp_parser.parse_args(push_pull_args)
+    except SystemExit:
         return
 
-    # Handle pull command (remote → local markdown)
-    if len(sys.argv) > 1 and sys.argv[1] == 'pull':
-        push_pull_args = sys.argv[2:]
-        pp_parser = argparse.ArgumentParser(prog='mdsync pull')
-        pp_parser.add_argument('file', help='Markdown file to pull into (reads remote URL from frontmatter)')
-        pp_parser.add_argument('--secrets-file', type=str, metavar='PATH',
-                               help='Path to secrets.yaml file')
-        try:
-            pp = pp_parser.parse_args(push_pull_args)
-        except SystemExit:
-            return
+    markdown_path = pp.file
+    secrets_file_path = pp.secrets_file if pp.secrets_file else None
 
-        markdown_path = pp.file
-        secrets_file_path = pp.secrets_file if pp.secrets_file else None
+    # Parsed through the same cache the upload reads from
+    try:
+        fm = cached_frontmatter(markdown_path)
+    except FileNotFoundError:
+        print(f"Error: File not found: {markdown_path}", file=sys.stderr)
+        sys.exit(1)
 
+    gdoc_url = fm.get('gdoc_url')
+    confluence_url = fm.get('confluence_url')
+
+    if not gdoc_url and not confluence_url:
+        print("Error: No remote URL found in frontmatter (gdoc_url or confluence_url required)", file=sys.stderr)
+        sys.exit(1)
+
+    # Determine which destinations to push to
+    destinations = []
+    if gdoc_url:
+        destinations.append(('gdoc', gdoc_url))
+    if confluence_url:
+        destinations.append(('confluence', confluence_url))
+
+    if len(destinations) > 1:
+        print("Multiple destinations found in frontmatter:")
+        for i, (platform, url) in enumerate(destinations, 1):
+            print(f"  {i}. {platform.title()}: {url}")
         try:
-            with open(markdown_path, 'r', encoding='utf-8') as f:
-                markdown_content = f.read()
-        except FileNotFoundError:
-            print(f"Error: File not found: {markdown_path}", file=sys.stderr)
+            choice = input("Choose destination (1-{}): ".format(len(destinations)))
+            choice_idx = int(choice) - 1
+            if 0 <= choice_idx < len(destinations):
+                destinations = [destinations[choice_idx]]
+            else:
+                print("Invalid choice", file=sys.stderr)
+                sys.exit(1)
+        except (ValueError, KeyboardInterrupt):
+            print("Cancelled", file=sys.stderr)
             sys.exit(1)
 
-        fm = extract_frontmatter_metadata(markdown_content)
-        gdoc_url = fm.get('gdoc_url')
-        confluence_url = fm.get('confluence_url')
+    for platform, url in destinations:
+        if platform == 'gdoc':
+            doc_id = extract_doc_id_from_url(url) or extract_doc_id(url)
+            if not doc_id:
+                print(f"Error: Could not extract Google Doc ID from: {url}", file=sys.stderr)
+                sys.exit(1)
+            creds = get_credentials()
+            print(f"Pushing {markdown_path} to Google Doc...")
+            import_markdown_to_gdoc(markdown_path, doc_id, creds)
+            print(f"Done. {url}")
+        elif platform == 'confluence':
+            parsed = parse_confluence_destination(url)
+            page_id = parsed.get('page_id')
+            if not page_id:
+                print(f"Error: Could not extract Confluence page ID from: {url}", file=sys.stderr)
+                sys.exit(1)
+            confluence = get_confluence_client(secrets_file_path)
+            print(f"Pushing {markdown_path} to Confluence page {page_id}...")
+            import_markdown_to_confluence(markdown_path, page_id, confluence)
+            print(f"Done. {url}")
+
+
+def _run_pull_command(push_pull_args: list) -> None:
+    """Parse 'pull' subcommand arguments and pull a markdown file's frontmatter source into it."""
+    pp_parser = argparse.ArgumentParser(prog='mdsync pull')
+    pp_parser.add_argument('file', help='Markdown file to pull into (reads remote URL from frontmatter)')
+    pp_parser.add_argument('--secrets-file', type=str, metavar='PATH',
+                           help='Path to secrets.yaml file')
+    try:
+        pp = pp_parser.parse_args(push_pull_args)
+    except SystemExit:
+        return
 
-        if not gdoc_url and not confluence_url:
-            print("Error: No remote URL found in frontmatter (gdoc_url or confluence_url required)", file=sys.stderr)
+    markdown_path = pp.file
+    secrets_file_path = pp.secrets_file if pp.secrets_file else None
+
+    # Only the frontmatter is needed; the file is overwritten by the pull
+    try:
+        fm = read_frontmatter_metadata(markdown_path)
+    except FileNotFoundError:
+        print(f"Error: File not found: {markdown_path}", file=sys.stderr)
+        sys.exit(1)
+
+    gdoc_url = fm.get('gdoc_url')
+    confluence_url = fm.get('confluence_url')
+
+    if not gdoc_url and not confluence_url:
+        print("Error: No remote URL found in frontmatter (gdoc_url or confluence_url required)", file=sys.stderr)
+        sys.exit(1)
+
+    # Determine which source to pull from
+    sources = []
+    if gdoc_url:
+        sources.append(('gdoc', gdoc_url))
+    if confluence_url:
+        sources.append(('confluence', confluence_url))
+
+    if len(sources) > 1:
+        print("Multiple sources found in frontmatter:")
+        for i, (platform, url) in enumerate(sources, 1):
+            print(f"  {i}. {platform.title()}: {url}")
+        try:
+            choice = input("Choose source to pull from (1-{}): ".format(len(sources)))
+            choice_idx = int(choice) - 1
+            if 0 <= choice_idx < len(sources):
+                sources = [sources[choice_idx]]
+            else:
+                print("Invalid choice", file=sys.stderr)
+                sys.exit(1)
+        except (ValueError, KeyboardInterrupt):
+            print("Cancelled", file=sys.stderr)
             sys.exit(1)
 
-        # Determine which source to pull from
-        sources = []
-        if gdoc_url:
-            sources.append(('gdoc', gdoc_url))
-        if confluence_url:
-            sources.append(('confluence', confluence_url))
-
-        if len(sources) > 1:
-            print("Multiple sources found in frontmatter:")
-            for i, (platform, url) in enumerate(sources, 1):
-                print(f"  {i}. {platform.title()}: {url}")
-            try:
-                choice = input("Choose source to pull from (1-{}): ".format(len(sources)))
-                choice_idx = int(choice) - 1
-                if 0 <= choice_idx < len(sources):
-                    sources = [sources[choice_idx]]
-                else:
-                    print("Invalid choice", file=sys.stderr)
-                    sys.exit(1)
-            except (ValueError, KeyboardInterrupt):
-                print("Cancelled", file=sys.stderr)
+    for platform, url in sources:
+        if platform == 'gdoc':
+            doc_id = extract_doc_id_from_url(url) or extract_doc_id(url)
+            if not doc_id:
+                print(f"Error: Could not extract Google Doc ID from: {url}", file=sys.stderr)
                 sys.exit(1)
+            creds = get_credentials()
+            print(f"Pulling from Google Doc into {markdown_path}...")
+            export_gdoc_to_markdown(doc_id, creds, markdown_path)
+            print(f"Done.")
+        elif platform == 'confluence':
+            parsed = parse_confluence_destination(url)
+            page_id = parsed.get('page_id')
+            if not page_id:
+                print(f"Error: Could not extract Confluence page ID from: {url}", file=sys.stderr)
+                sys.exit(1)
+            confluence = get_confluence_client(secrets_file_path)
+            print(f"Pulling from Confluence page {page_id} into {markdown_path}...")
+            export_confluence_to_markdown(page_id, confluence, markdown_path)
+            print(f"Done.")
 
-        for platform, url in sources:
-            if platform == 'gdoc':
-                doc_id = extract_doc_id_from_url(url) or extract_doc_id(url)
-                if not doc_id:
-                    print(f"Error: Could not extract Google Doc ID from: {url}", file=sys.stderr)
-                    sys.exit(1)
-                creds = get_credentials()
-                print(f"Pulling from Google Doc into {markdown_path}...")
-                export_gdoc_to_markdown(doc_id, creds, markdown_path)
-                print(f"Done.")
-            elif platform == 'confluence':
-                parsed = parse_confluence_destination(url)
-                page_id = parsed.get('page_id')
-                if not page_id:
-                    print(f"Error: Could not extract Confluence page ID from: {url}", file=sys.stderr)
-                    sys.exit(1)
-                confluence = get_confluence_client(secrets_file_path)
-                print(f"Pulling from Confluence page {page_id} into {markdown_path}...")
-                export_confluence_to_markdown(page_id, confluence, markdown_path)
-                print(f"Done.")
+
+# Subcommand name -> handler taking the arguments that follow it
+_SUBCOMMANDS = {
+    'list': _run_list_command,
+    'push': _run_push_command,
+    'pull': _run_pull_command,
+}
+
+
+def main():
+    # Subcommands have their own parsers and never build the main one
+    if len(sys.argv) > 1 and sys.argv[1] in _SUBCOMMANDS:
+        _SUBCOMMANDS[sys.argv[1]](sys.argv[2:])
         return
 
-    args = parser.parse_args()
+    args = _build_parser().parse_args()
     
     # Extract secrets_file_path early for use throughout main()
-    secrets_file_path = args.secrets_file if hasattr(args, 'secrets_file') and args.secrets_file else None
+    # --secrets-file is always defined (default None); treat an empty value as unset
+    secrets_file_path = args.secrets_file or None
     
     # Handle --create-empty command (must be before type detection)
     if args.create_empty:
@@ -4030,8 +4794,19 @@ def main():
     # Handle --batch command (must be before type detection)
     if args.batch:
         if not args.batch:
-            print("Error: At least one markdown file required for --batch", file=sys.stderr)
-            print("Use: mdsync --batch file1.md file2.md file3.md", file=sys.stderr)
+            print("Error: At least one markdown file required for --batch\n"
+                  "Use: mdsync --batch file1.md file2.md file3.md", file=sys.stderr)
+            sys.exit(1)
+        
+        # Read and parse every input file once; the checks below and the
+        # document build all work from this
+        batch_inputs = _load_batch_inputs(args.batch)
+        batch_paths = frozenset(os.path.realpath(path) for path in args.batch)
+        
+        # Stop before any credential or network setup if an input couldn't be read
+        missing = [path for path in args.batch if path not in batch_inputs]
+        if missing:
+            print(f"Error: Could not read batch file(s): {', '.join(missing)}", file=sys.stderr)
             sys.exit(1)
         
         # Determine document title
@@ -4039,13 +4814,8 @@ def main():
             title = args.batch_title
         else:
             # Use first markdown file's title
-            try:
-                with open(args.batch[0], 'r', encoding='utf-8') as f:
-                    first_content = f.read()
-                metadata = extract_frontmatter_metadata(first_content)
-                title = metadata.get('title') or Path(args.batch[0]).stem.replace('_', ' ').replace('-', ' ').title()
-            except Exception:
-                title = "Batch Document"
+            metadata = batch_inputs[args.batch[0]]['metadata']
+            title = metadata.get('title') or Path(args.batch[0]).stem.replace('_', ' ').replace('-', ' ').title()
         
         # Check if files already belong to an existing batch
         existing_batch_doc_id = None
@@ -4054,9 +4824,9 @@ def main():
         
         for markdown_path in args.batch:
             try:
-                with open(markdown_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                metadata = extract_frontmatter_metadata(content)
+                if markdown_path not in batch_inputs:
+                    continue
+                metadata = batch_inputs[markdown_path]['metadata']
                 
                 if 'batch' in metadata and isinstance(metadata['batch'], dict):
                     batch_info = metadata['batch']
@@ -4084,44 +4854,46 @@ def main():
                 # Get the directory of the first file
                 first_file_dir = os.path.dirname(args.batch[0]) if args.batch else "."
                 
-                # Scan directory for all markdown files that belong to this batch
-                for filename in os.listdir(first_file_dir):
-                    if filename.endswith('.md'):
-                        file_path = os.path.join(first_file_dir, filename)
-                        try:
-                            with open(file_path, 'r', encoding='utf-8') as f:
-                                content = f.read()
-                            metadata = extract_frontmatter_metadata(content)
-                            
-                            if ('batch' in metadata and 
-                                isinstance(metadata['batch'], dict) and
-                                metadata['batch'].get('doc_id') == existing_batch_doc_id):
-                                all_files_in_existing_batch.append(file_path)
-                        except Exception:
-                            continue
+                # Scan directory for all markdown files that belong to this batch.
+                # A bare filename's directory is '', which scandir can't open.
+                with os.scandir(first_file_dir or '.') as entries:
+                    # Keep paths in the same form as the --batch arguments
+                    candidates = [entry.path if first_file_dir else entry.name
+                                  for entry in entries
+                                  if entry.name.endswith('.md') and entry.is_file(follow_symlinks=False)]
+                
+                if candidates:
+                    with ThreadPoolExecutor(max_workers=min(_SCAN_WORKERS, len(candidates))) as executor:
+                        matches = executor.map(functools.partial(_check_file_in_batch, expected_doc_id=existing_batch_doc_id), candidates)
+                        all_files_in_existing_batch = [file_path for file_path in matches if file_path is not None]
             except Exception:
                 # If directory scanning fails, fall back to just the processed files
                 all_files_in_existing_batch = files_in_existing_batch
         
         # If all files belong to the same existing batch, offer to update it
         if existing_batch_doc_id and existing_batch_doc_id != "MIXED" and not args.force:
-            print(f"\n📋 Found existing batch: '{existing_batch_title}'")
-            print(f"   Document ID: {existing_batch_doc_id}")
-            print(f"   Files in batch: {len(all_files_in_existing_batch)}")
+            # Build the whole warning and write it at once, ahead of the prompt
+            lines = [
+                f"\n📋 Found existing batch: '{existing_batch_title}'",
+                f"   Document ID: {existing_batch_doc_id}",
+                f"   Files in batch: {len(all_files_in_existing_batch)}",
+            ]
             
-            # Check for files that will be excluded from the new batch
-            new_batch_files = set(args.batch)
-            existing_batch_files = set(all_files_in_existing_batch)
-            excluded_files = existing_batch_files - new_batch_files
+            # Check for files that will be excluded from the new batch, comparing
+            # canonical paths so './a.md', 'a.md' and symlinks agree
+            excluded_files = sorted({(os.path.basename(file_path), file_path)
+                                     for file_path in all_files_in_existing_batch
+                                     if os.path.realpath(file_path) not in batch_paths})
             
             if excluded_files:
-                print(f"\n⚠️  Warning: {len(excluded_files)} file(s) from the existing batch will NOT be included in the new batch:")
-                for file_path in sorted(excluded_files):
-                    print(f"   • {os.path.basename(file_path)}")
-                print(f"   These files will remain in the existing batch document.")
+                lines.append(f"\n⚠️  Warning: {len(excluded_files)} file(s) from the existing batch will NOT be included in the new batch:")
+                lines.extend(f"   • {file_name}" for file_name, _ in excluded_files)
+                lines.append(f"   These files will remain in the existing batch document.")
             
-            print(f"\nThis will create a NEW batch document instead of updating the existing one.")
-            print(f"To update the existing batch, use: mdsync '{existing_batch_title}' --batch-update")
+            lines.append(f"\nThis will create a NEW batch document instead of updating the existing one.")
+            lines.append(f"To update the existing batch, use: mdsync '{existing_batch_title}' --batch-update")
+            sys.stdout.write('\n'.join(lines) + '\n')
+            sys.stdout.flush()
             
             try:
                 response = input("Do you want to create a new batch document? [y/N]: ").strip().lower()
@@ -4136,20 +4908,18 @@ def main():
         elif not args.force:
             files_with_individual_gdoc = []
             for markdown_path in args.batch:
-                try:
-                    with open(markdown_path, 'r', encoding='utf-8') as f:
-                        content = f.read()
-                    metadata = extract_frontmatter_metadata(content)
-                    if metadata.get('gdoc_url') and not metadata.get('batch'):
-                        files_with_individual_gdoc.append(markdown_path)
-                except Exception:
+                if markdown_path not in batch_inputs:
                     continue
+                metadata = batch_inputs[markdown_path]['metadata']
+                if metadata.get('gdoc_url') and not metadata.get('batch'):
+                    files_with_individual_gdoc.append(os.path.basename(markdown_path))
             
             if files_with_individual_gdoc:
-                print(f"\n⚠️  Warning: {len(files_with_individual_gdoc)} file(s) have individual Google Doc links:")
-                for file_path in files_with_individual_gdoc:
-                    print(f"   {os.path.basename(file_path)}")
-                print(f"\nThis batch operation will update these links to point to the new batch document.")
+                lines = [f"\n⚠️  Warning: {len(files_with_individual_gdoc)} file(s) have individual Google Doc links:"]
+                lines.extend(f"   {file_name}" for file_name in files_with_individual_gdoc)
+                lines.append(f"\nThis batch operation will update these links to point to the new batch document.")
+                sys.stdout.write('\n'.join(lines) + '\n')
+                sys.stdout.flush()
                 
                 try:
                     response = input("Do you want to continue? [y/N]: ").strip().lower()
@@ -4163,7 +4933,7 @@ def main():
         # Create the batch document
         # Include title only if --batch-title was explicitly provided
         include_title = args.batch_title is not None
-        doc_id = create_batch_document_simple(args.batch, title, quiet=args.url_only, include_headers=args.batch_headers, include_horizontal_sep=args.batch_horizontal_sep, include_title=include_title, include_toc=args.batch_toc)
+        doc_id = create_batch_document_simple(args.batch, title, quiet=args.url_only, include_headers=args.batch_headers, include_horizontal_sep=args.batch_horizontal_sep, include_title=include_title, include_toc=args.batch_toc, batch_inputs=batch_inputs)
         if doc_id:
             if args.url_only:
                 print(f"https://docs.google.com/document/d/{doc_id}/edit")
@@ -4176,9 +4946,7 @@ def main():
     
     # Validate required arguments (skip for list-batch and batch-update which use different sources)
     if not args.source and not args.list_batch and not args.batch_update:
-        print("Error: Source is required", file=sys.stderr)
-        print("Use: mdsync <source> [destination] or mdsync list [file_or_directory]", file=sys.stderr)
-        print("Run 'mdsync --help' for more information", file=sys.stderr)
+        sys.stderr.write(_SOURCE_REQUIRED_HELP)
         sys.exit(1)
     
     # Determine source and destination types
@@ -4190,80 +4958,107 @@ def main():
     dest_is_gdoc = args.destination and is_google_doc(args.destination)
     dest_is_markdown = args.destination and not dest_is_confluence and not dest_is_gdoc
     
+    # Reject a source-only operation on the wrong kind of source before any
+    # credentials are loaded; argparse allows at most one of these operations
+    source_kind = 'gdoc' if source_is_gdoc else 'confluence' if source_is_confluence else 'markdown'
+    for flags, required_kind, message in _SOURCE_KIND_REQUIREMENTS:
+        if any(getattr(args, flag) for flag in flags):
+            if source_kind != required_kind:
+                _build_parser().error(message)
+            break
+    
+    # Parse document IDs once; the branches below reuse these instead of
+    # re-extracting from the same argument
+    source_doc_id = extract_doc_id(args.source) if source_is_gdoc else None
+    dest_doc_id = extract_doc_id(args.destination) if dest_is_gdoc else None
+    source_page_id = parse_confluence_destination(args.source)['page_id'] if source_is_confluence else None
+    dest_page_id = parse_confluence_destination(args.destination)['page_id'] if dest_is_confluence else None
+    
+    # Reject malformed invocations that need no network access before any
+    # credentials are loaded or clients are built
+    if args.diff and not ((source_is_markdown and (dest_is_gdoc or dest_is_confluence)) or
+                          ((source_is_gdoc or source_is_confluence) and dest_is_markdown)):
+        sys.stderr.write(_DIFF_HELP)
+        sys.exit(1)
+    if source_is_confluence and not source_page_id and not args.diff:
+        print("Error: Could not extract Confluence page ID", file=sys.stderr)
+        sys.exit(1)
+    if (source_is_gdoc or source_is_confluence) and not args.destination and \
+            not any(getattr(args, flag) for flag in _PRE_EXPORT_FLAGS):
+        print("Error: Destination markdown file required", file=sys.stderr)
+        sys.exit(1)
+    if source_is_markdown and args.create_confluence and not args.space:
+        print("Error: --space required with --create-confluence", file=sys.stderr)
+        sys.exit(1)
+    if source_is_markdown and dest_is_confluence and not dest_page_id and \
+            not args.create_confluence and not args.diff:
+        print("Error: Could not extract Confluence page ID from destination", file=sys.stderr)
+        sys.exit(1)
+    
     # Get appropriate credentials early for diff operations and intelligent destination detection
     creds = None
-    confluence = None
     
     # Only get Google credentials when actually needed (for Google Doc operations)
     if source_is_gdoc or dest_is_gdoc or args.create or args.lock or args.unlock or args.lock_status or args.list_revisions or args.list_comments or (args.diff and (source_is_gdoc or dest_is_gdoc)):
         creds = get_credentials()
     
-    if source_is_confluence or dest_is_confluence or args.create_confluence or (args.diff and (source_is_confluence or dest_is_confluence)):
-        confluence = get_confluence_client(args.secrets_file if hasattr(args, 'secrets_file') else None)
+    # The Confluence client is only set up once a Confluence branch calls it;
+    # lock operations talk to the REST API with raw credentials and never do
+    confluence = LazyConfluenceClient(secrets_file_path)
     
     # Handle diff operations (dry run) - must be before intelligent destination detection
     if args.diff:
         if source_is_markdown and dest_is_gdoc:
             # Markdown → Google Doc diff
-            doc_id = extract_doc_id(args.destination)
-            diff_markdown_to_gdoc(args.source, doc_id, creds)
+            diff_markdown_to_gdoc(args.source, dest_doc_id, creds)
         elif source_is_gdoc and dest_is_markdown:
             # Google Doc → Markdown diff
-            doc_id = extract_doc_id(args.source)
-            diff_gdoc_to_markdown(doc_id, args.destination, creds)
+            diff_gdoc_to_markdown(source_doc_id, args.destination, creds)
         elif source_is_markdown and dest_is_confluence:
             # Markdown → Confluence diff
             diff_markdown_to_confluence(args.source, args.destination, confluence)
         elif source_is_confluence and dest_is_markdown:
             # Confluence → Markdown diff
             diff_confluence_to_markdown(args.source, args.destination, confluence)
-        else:
-            print("Error: --diff requires both source and destination", file=sys.stderr)
-            print("Supported diff combinations:", file=sys.stderr)
-            print("  markdown_file google_doc_url --diff", file=sys.stderr)
-            print("  google_doc_url markdown_file --diff", file=sys.stderr)
-            print("  markdown_file confluence:SPACE/PAGE_ID --diff", file=sys.stderr)
-            print("  confluence:SPACE/PAGE_ID markdown_file --diff", file=sys.stderr)
-            sys.exit(1)
         return
     
     # Intelligent destination detection for markdown files
     if source_is_markdown and not args.destination and not args.create and not args.create_confluence and not args.list_batch:
         # Check if markdown has frontmatter with URLs
         try:
-            with open(args.source, 'r', encoding='utf-8') as f:
-                markdown_content = f.read()
-            
-            frontmatter = extract_frontmatter_metadata(markdown_content)
+            frontmatter = cached_frontmatter(args.source)
             gdoc_url = frontmatter.get('gdoc_url')
             confluence_url = frontmatter.get('confluence_url')
             
             available_destinations = []
             frozen_destinations = []
             
+            doc_id = extract_doc_id_from_url(gdoc_url) if gdoc_url else None
+            # Parse Confluence URL to get page ID
+            page_id = parse_confluence_destination(confluence_url).get('page_id') if confluence_url else None
+            
+            # The two frozen checks are independent round-trips, so run them concurrently
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                gdoc_future = executor.submit(check_gdoc_frozen_status, doc_id, creds) if doc_id else None
+                confluence_future = executor.submit(check_confluence_frozen_status, page_id, confluence) if page_id else None
+                gdoc_frozen = gdoc_future.result() if gdoc_future else False
+                confluence_frozen = confluence_future.result() if confluence_future else False
+            
             # Check Google Doc
-            if gdoc_url:
-                doc_id = extract_doc_id_from_url(gdoc_url)
-                if doc_id:
-                    # Check if frozen at runtime
-                    if check_gdoc_frozen_status(doc_id, creds):
-                        frozen_destinations.append(('gdoc', gdoc_url))
-                        print(f"⚠️  Google Doc is frozen: {gdoc_url}")
-                    else:
-                        available_destinations.append(('gdoc', f"https://docs.google.com/document/d/{doc_id}/edit", gdoc_url))
+            if doc_id:
+                if gdoc_frozen:
+                    frozen_destinations.append(('gdoc', gdoc_url))
+                    print(f"⚠️  Google Doc is frozen: {gdoc_url}")
+                else:
+                    available_destinations.append(('gdoc', f"https://docs.google.com/document/d/{doc_id}/edit", gdoc_url))
             
             # Check Confluence
-            if confluence_url:
-                # Parse Confluence URL to get page ID
-                dest_info = parse_confluence_destination(confluence_url)
-                page_id = dest_info.get('page_id')
-                if page_id:
-                    # Check if frozen at runtime
-                    if check_confluence_frozen_status(page_id, confluence):
-                        frozen_destinations.append(('confluence', confluence_url))
-                        print(f"⚠️  Confluence page is frozen: {confluence_url}")
-                    else:
-                        available_destinations.append(('confluence', confluence_url, confluence_url))
+            if page_id:
+                if confluence_frozen:
+                    frozen_destinations.append(('confluence', confluence_url))
+                    print(f"⚠️  Confluence page is frozen: {confluence_url}")
+                else:
+                    available_destinations.append(('confluence', confluence_url, confluence_url))
             
             if not available_destinations:
                 print("Error: No destination specified and no available URLs in frontmatter", file=sys.stderr)
@@ -4275,8 +5070,9 @@ def main():
             elif len(available_destinations) == 1:
                 # Single destination - auto-select
                 platform, url, original_url = available_destinations[0]
-                print(f"Found {platform} URL in frontmatter: {original_url}")
-                print(f"Auto-syncing to {platform.title()}")
+                if not args.url_only:
+                    print(f"Found {platform} URL in frontmatter: {original_url}\n"
+                          f"Auto-syncing to {platform.title()}")
                 args.destination = url
                 if platform == 'gdoc':
                     dest_is_gdoc = True
@@ -4284,9 +5080,10 @@ def main():
                     dest_is_confluence = True
             else:
                 # Multiple destinations - ask user to choose
-                print("Multiple destinations found in frontmatter:")
+                menu = ["Multiple destinations found in frontmatter:"]
                 for i, (platform, url, original_url) in enumerate(available_destinations, 1):
-                    print(f"  {i}. {platform.title()}: {original_url}")
+                    menu.append(f"  {i}. {platform.title()}: {original_url}")
+                print("\n".join(menu))
                 
                 try:
                     choice = input("Choose destination (1-{}): ".format(len(available_destinations)))
@@ -4313,28 +5110,28 @@ def main():
     # Late credential initialization for auto-detected destinations
     if dest_is_gdoc and creds is None:
         creds = get_credentials()
-    if dest_is_confluence and confluence is None:
-        confluence = get_confluence_client(args.secrets_file if hasattr(args, 'secrets_file') else None)
+    if dest_is_gdoc and dest_doc_id is None:
+        dest_doc_id = extract_doc_id(args.destination)
+    if dest_is_confluence and dest_page_id is None:
+        dest_page_id = parse_confluence_destination(args.destination)['page_id']
 
     # Check for destination mismatch warnings
     if source_is_markdown and dest_is_gdoc and args.destination and not args.list_batch:
         try:
-            with open(args.source, 'r', encoding='utf-8') as f:
-                markdown_content = f.read()
-            
-            frontmatter = extract_frontmatter_metadata(markdown_content)
+            frontmatter = cached_frontmatter(args.source)
             frontmatter_gdoc_url = frontmatter.get('gdoc_url')
             
             if frontmatter_gdoc_url:
                 frontmatter_doc_id = extract_doc_id_from_url(frontmatter_gdoc_url)
-                dest_doc_id = extract_doc_id(args.destination)
-                
                 if frontmatter_doc_id and dest_doc_id and frontmatter_doc_id != dest_doc_id:
-                    print(f"⚠️  WARNING: Destination mismatch!", file=sys.stderr)
-                    print(f"   Frontmatter gdoc_url: {frontmatter_gdoc_url}", file=sys.stderr)
-                    print(f"   Command destination:  {args.destination}", file=sys.stderr)
-                    print(f"   This will sync to a different Google Doc than expected.", file=sys.stderr)
-                    print(f"   Continue? (y/N): ", end='', file=sys.stderr)
+                    sys.stderr.write(
+                        "⚠️  WARNING: Destination mismatch!\n"
+                        f"   Frontmatter gdoc_url: {frontmatter_gdoc_url}\n"
+                        f"   Command destination:  {args.destination}\n"
+                        "   This will sync to a different Google Doc than expected.\n"
+                        "   Continue? (y/N): "
+                    )
+                    sys.stderr.flush()
                     
                     try:
                         response = input().strip().lower()
@@ -4351,11 +5148,7 @@ def main():
     
     # Handle lock/unlock operations
     if args.lock or args.unlock or args.lock_status:
-        if not source_is_gdoc:
-            print("Error: Lock operations only work with Google Docs", file=sys.stderr)
-            sys.exit(1)
-        
-        doc_id = extract_doc_id(args.source)
+        doc_id = source_doc_id
         
         if args.lock:
             reason = args.lock_reason or "Document locked via mdsync"
@@ -4369,36 +5162,19 @@ def main():
     
     # Handle --list-comments flag
     if args.list_comments:
-        if not source_is_gdoc:
-            print("Error: --list-comments only works with Google Docs", file=sys.stderr)
-            sys.exit(1)
-        
-        doc_id = extract_doc_id(args.source)
+        doc_id = source_doc_id
         list_comments(doc_id, creds, unresolved_only=args.unresolved_only, output_format=args.format)
         return
     
     # Handle --list-revisions flag
     if args.list_revisions:
-        if not source_is_gdoc:
-            print("Error: --list-revisions only works with Google Docs", file=sys.stderr)
-            sys.exit(1)
-        
-        doc_id = extract_doc_id(args.source)
+        doc_id = source_doc_id
         list_revisions(doc_id, creds)
         return
     
     # Handle Confluence lock/unlock operations
     if args.lock_confluence or args.unlock_confluence or args.confluence_lock_status:
-        if not is_confluence_page(args.source):
-            print("Error: Source must be a Confluence page for lock operations", file=sys.stderr)
-            sys.exit(1)
-        
-        parsed = parse_confluence_destination(args.source)
-        page_id = parsed['page_id']
-        
-        if not page_id:
-            print("Error: Could not extract Confluence page ID", file=sys.stderr)
-            sys.exit(1)
+        page_id = source_page_id
         
         confluence_creds = get_confluence_credentials(secrets_file_path)
         if not confluence_creds:
@@ -4415,8 +5191,8 @@ def main():
                 secrets_file_path=secrets_file_path
             )
             if success:
-                print(f"✓ Page locked successfully")
-                print(f"  Only configured editors can now edit this page")
+                print("✓ Page locked successfully\n"
+                      "  Only configured editors can now edit this page")
             else:
                 print(f"✗ Failed to lock page", file=sys.stderr)
                 sys.exit(1)
@@ -4450,8 +5226,8 @@ def main():
     
     if args.list_batch:
         if not args.source:
-            print("Error: Directory required for --list-batch", file=sys.stderr)
-            print("Use: mdsync DIRECTORY --list-batch", file=sys.stderr)
+            print("Error: Directory required for --list-batch\n"
+                  "Use: mdsync DIRECTORY --list-batch", file=sys.stderr)
             sys.exit(1)
         
         # List batch groupings in markdown files
@@ -4460,83 +5236,62 @@ def main():
     
     if args.diff_batch:
         if not args.source:
-            print("Error: Google Doc ID required for --diff-batch", file=sys.stderr)
-            print("Use: mdsync DOC_ID --diff-batch", file=sys.stderr)
-            sys.exit(1)
-        
-        if not source_is_gdoc:
-            print("Error: --diff-batch only works with Google Docs", file=sys.stderr)
+            print("Error: Google Doc ID required for --diff-batch\n"
+                  "Use: mdsync DOC_ID --diff-batch", file=sys.stderr)
             sys.exit(1)
         
         # Diff entire batch against Google Doc
-        doc_id = extract_doc_id(args.source)
-        diff_batch_against_gdoc(doc_id, quiet=args.url_only)
+        doc_id = source_doc_id
+        diff_batch_against_gdoc(doc_id, quiet=args.url_only, parallelism=args.batch_parallelism)
         return
     
     if args.batch_update:
         if not args.source:
-            print("Error: Batch ID, title, or Google Doc ID required for --batch-update", file=sys.stderr)
-            print("Use: mdsync BATCH_ID --batch-update", file=sys.stderr)
-            print("     mdsync 'Batch Title' --batch-update", file=sys.stderr)
-            print("     mdsync DOC_ID --batch-update", file=sys.stderr)
+            print("Error: Batch ID, title, or Google Doc ID required for --batch-update\n"
+                  "Use: mdsync BATCH_ID --batch-update\n"
+                  "     mdsync 'Batch Title' --batch-update\n"
+                  "     mdsync DOC_ID --batch-update", file=sys.stderr)
             sys.exit(1)
         
         # Update existing batch by finding all files
-        update_batch_by_name(args.source, quiet=args.url_only)
+        update_batch_by_name(args.source, quiet=args.url_only, parallelism=args.batch_parallelism)
         return
     
     
     # Handle Confluence → Markdown
     if source_is_confluence:
-        if not args.destination:
-            print("Error: Destination markdown file required", file=sys.stderr)
-            sys.exit(1)
-        
-        parsed = parse_confluence_destination(args.source)
-        page_id = parsed['page_id']
-        
-        if not page_id:
-            print("Error: Could not extract Confluence page ID", file=sys.stderr)
-            sys.exit(1)
+        page_id = source_page_id
         
         if not args.url_only:
             print(f"Exporting Confluence page {page_id} to {args.destination}...")
         
         # Export with frontmatter
-        markdown_content = export_confluence_to_markdown(page_id, confluence, args.destination)
+        export_confluence_to_markdown(page_id, confluence, args.destination)
         
         if not args.url_only:
-            print(f"Successfully exported to {args.destination}")
-            print(f"Added confluence_url to frontmatter")
+            print(f"Successfully exported to {args.destination}\n"
+                  "Added confluence_url to frontmatter")
         return
     
     # Handle Google Doc → Markdown
     if source_is_gdoc:
-        if not args.destination:
-            print("Error: Destination markdown file required", file=sys.stderr)
-            sys.exit(1)
-        
-        doc_id = extract_doc_id(args.source)
+        doc_id = source_doc_id
         
         if not args.url_only:
             print(f"Exporting Google Doc {doc_id} to {args.destination}...")
         
         # Export with frontmatter
-        markdown_content = export_gdoc_to_markdown(doc_id, creds, args.destination)
+        export_gdoc_to_markdown(doc_id, creds, args.destination)
         
         if not args.url_only:
-            print(f"Successfully exported to {args.destination}")
-            print(f"Added metadata to frontmatter: title, gdoc_url, gdoc_created, gdoc_modified")
+            print(f"Successfully exported to {args.destination}\n"
+                  "Added metadata to frontmatter: title, gdoc_url, gdoc_created, gdoc_modified")
         return
     
     # Handle Markdown → Confluence
     if source_is_markdown and (dest_is_confluence or args.create_confluence):
         if args.create_confluence:
             # Create new Confluence page
-            if not args.space:
-                print("Error: --space required with --create-confluence", file=sys.stderr)
-                sys.exit(1)
-            
             # Title is optional - will use frontmatter or filename if not provided
             labels = args.labels.split(',') if args.labels else None
             
@@ -4549,30 +5304,20 @@ def main():
             )
             
             if args.url_only:
-                # Get the page URL
-                page = confluence.get_page_by_id(page_id)
-                base_url = confluence.url.rstrip('/')
-                print(f"{base_url}/wiki/spaces/{args.space}/pages/{page_id}")
+                # The space and ID are already known, so no lookup is needed
+                print(confluence_page_url(confluence, args.space, page_id))
         
         elif dest_is_confluence:
             # Update existing Confluence page
-            parsed = parse_confluence_destination(args.destination)
-            page_id = parsed['page_id']
-            
-            if not page_id:
-                print("Error: Could not extract Confluence page ID from destination", file=sys.stderr)
-                sys.exit(1)
+            page_id = dest_page_id
             
             if not args.url_only:
                 print(f"Updating Confluence page {page_id}...")
             
-            import_markdown_to_confluence(args.source, page_id, confluence, quiet=args.url_only)
+            page_url = import_markdown_to_confluence(args.source, page_id, confluence, quiet=args.url_only)
             
             if args.url_only:
-                page = confluence.get_page_by_id(page_id)
-                space_key = page['space']['key']
-                base_url = confluence.url.rstrip('/')
-                print(f"{base_url}/wiki/spaces/{space_key}/pages/{page_id}")
+                print(page_url)
         
         return
     
@@ -4598,28 +5343,27 @@ def main():
                 print("Error: Destination Google Doc URL/ID required (or use --create)", file=sys.stderr)
                 sys.exit(1)
             
-            doc_id = extract_doc_id(args.destination)
+            doc_id = dest_doc_id
+            
+            try:
+                metadata = cached_frontmatter(args.source)
+            except Exception:
+                metadata = None
             
             # Check for existing gdoc_url and ask for confirmation
-            if not check_existing_gdoc_confirmation(args.source, args.force, doc_id):
+            if not check_existing_gdoc_confirmation(args.source, args.force, doc_id, metadata=metadata):
                 sys.exit(0)
             
             # Check if this is a batch file
             try:
-                with open(args.source, 'r', encoding='utf-8') as f:
-                    markdown_content = f.read()
-                
-                metadata = extract_frontmatter_metadata(markdown_content)
-                
                 if 'batch' in metadata and isinstance(metadata['batch'], dict):
                     batch_info = metadata['batch']
                     if batch_info.get('doc_id') == doc_id:
                         if not args.url_only:
-                            print(f"Note: This file is part of a batch document")
-                            print(f"Batch: {batch_info.get('batch_title', 'Unknown')}")
-                            print(f"Heading: {batch_info.get('heading_title', 'Unknown')}")
-                            print(f"Consider using: mdsync {doc_id} --diff-batch")
-                            print()
+                            print("Note: This file is part of a batch document\n"
+                                  f"Batch: {batch_info.get('batch_title', 'Unknown')}\n"
+                                  f"Heading: {batch_info.get('heading_title', 'Unknown')}\n"
+                                  f"Consider using: mdsync {doc_id} --diff-batch\n")
             except Exception:
                 pass  # Not a batch file, continue with normal processing
             
@@ -4633,8 +5377,8 @@ def main():
         return
     
     # If we get here, show error
-    print("Error: Invalid source/destination combination", file=sys.stderr)
-    print("Run 'mdsync --help' for usage examples", file=sys.stderr)
+    print("Error: Invalid source/destination combination\n"
+          "Run 'mdsync --help' for usage examples", file=sys.stderr)
     sys.exit(1)
 
 
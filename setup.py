@@ -35,6 +35,10 @@ setup(
         'html2text>=2020.1.16',
         'python-frontmatter>=1.0.0',
     ],
+    extras_require={
+        # Faster JSON parsing for large Google Docs API responses
+        'fast': ['orjson>=3.6.0'],
+    },
     entry_points={
         'console_scripts': [
             'mdsync=mdsync:main',